@@ -9,6 +9,8 @@ import os
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import insert
+
 from app.core.config import get_settings
 from app.core.database_service import get_db_session
 from app.models.ingredient import IngredientCategory, Ingredient
@@ -44,8 +46,9 @@ def update_ingredient_categories():
                 print(f"✅ Added {added_categories} new categories")
             else:
                 print("ℹ️  All categories already exist")
-                
-            return category_objects
+            
+            # Plain ids so callers don't touch ORM objects after this session closes
+            return {name: category.id for name, category in category_objects.items()}
             
     except Exception as e:
         print(f"❌ Error updating categories: {e}")
@@ -58,7 +61,7 @@ def add_updated_ingredients():
     try:
         with get_db_session() as session:
             # Update categories first
-            category_objects = update_ingredient_categories()
+            category_ids = update_ingredient_categories()
             
             # Get existing ingredients to avoid duplicates
             existing_ingredients = session.query(Ingredient.name).all()
@@ -67,21 +70,19 @@ def add_updated_ingredients():
             print(f"Found {len(existing_names)} existing ingredients")
             
             # Add only new ingredients that don't already exist
-            added_count = 0
+            rows = []
             skipped_count = 0
             
             for name, category_name, unit, nutrition in INGREDIENTS_DATA:
                 if name not in existing_names:
-                    if category_name in category_objects:
-                        ingredient = Ingredient(
-                            name=name,
-                            category_id=category_objects[category_name].id,
-                            unit=unit,
-                            nutritional_info=nutrition,
-                            allergens=[]
-                        )
-                        session.add(ingredient)
-                        added_count += 1
+                    if category_name in category_ids:
+                        rows.append({
+                            "name": name,
+                            "category_id": category_ids[category_name],
+                            "unit": unit,
+                            "nutritional_info": nutrition._asdict(),
+                            "allergens": []
+                        })
                         print(f"  + Added: {name} ({category_name})")
                     else:
                         print(f"  - Skipped (category not found): {name} ({category_name})")
@@ -90,9 +91,11 @@ def add_updated_ingredients():
                     print(f"  - Skipped existing: {name}")
                     skipped_count += 1
             
-            # Commit all changes
+            # One executemany for all new rows instead of an INSERT per ORM object
+            if rows:
+                session.execute(insert(Ingredient), rows)
             session.commit()
-            print(f"✅ Successfully added {added_count} new ingredients")
+            print(f"✅ Successfully added {len(rows)} new ingredients")
             print(f"ℹ️  Skipped {skipped_count} existing/invalid ingredients")
             
             # Show final count
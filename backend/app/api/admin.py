@@ -8,9 +8,9 @@ from fastapi import APIRouter, HTTPException, Header
 from pydantic import BaseModel
 from sqlalchemy import text
 
-from ..core.database_service import get_db_session
+from ..core.database_service import get_db_session, get_db_read_session
 from ..core.auth_service import AuthService
-from ..core.security import hash_password
+from ..core.security import hash_password_async
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger(__name__)
@@ -62,7 +62,7 @@ async def get_all_users(authorization: str = Header(None)):
     """Admin endpoint to view all users"""
     require_admin(authorization)
     
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         result = session.execute(text('''
             SELECT id, email, name, timezone, is_active, is_admin, created_at, hashed_password
             FROM users 
@@ -91,7 +91,7 @@ async def get_all_family_members(authorization: str = Header(None)):
     require_admin(authorization)
     
     try:
-        with get_db_session() as session:
+        with get_db_read_session() as session:
             result = session.execute(text('''
                 SELECT fm.id, fm.user_id, fm.name, fm.age, fm.dietary_restrictions, fm.preferences, fm.created_at,
                        u.email as user_email, u.name as user_name
@@ -104,7 +104,7 @@ async def get_all_family_members(authorization: str = Header(None)):
             response_data = []
             for member in family_members:
                 try:
-                    # Parse dietary_restrictions with better error handling
+                    # jsonb columns arrive already decoded; tables not yet converted hold JSON text
                     dietary_restrictions = []
                     if member[4]:  # dietary_restrictions field
                         try:
@@ -112,13 +112,9 @@ async def get_all_family_members(authorization: str = Header(None)):
                                 dietary_restrictions = json.loads(member[4])
                             elif isinstance(member[4], list):
                                 dietary_restrictions = member[4]
-                            else:
-                                dietary_restrictions = []
                         except (json.JSONDecodeError, TypeError) as e:
                             logger.warning(f"Failed to parse dietary_restrictions for family member {member[0]}: {e}")
-                            dietary_restrictions = []
                     
-                    # Parse preferences with better error handling
                     preferences = {}
                     if member[5]:  # preferences field
                         try:
@@ -126,11 +122,8 @@ async def get_all_family_members(authorization: str = Header(None)):
                                 preferences = json.loads(member[5])
                             elif isinstance(member[5], dict):
                                 preferences = member[5]
-                            else:
-                                preferences = {}
                         except (json.JSONDecodeError, TypeError) as e:
                             logger.warning(f"Failed to parse preferences for family member {member[0]}: {e}")
-                            preferences = {}
                     
                     response_data.append({
                         'id': str(member[0]),
@@ -290,7 +283,7 @@ async def admin_reset_user_password(
                 raise HTTPException(status_code=404, detail="User not found")
             
             # Hash the new password
-            hashed_password = hash_password(request.new_password)
+            hashed_password = await hash_password_async(request.new_password)
             
             # Update user's password
             session.execute(text("UPDATE users SET hashed_password = :hashed_password WHERE id = :user_id"), 
@@ -313,7 +306,7 @@ async def get_all_pantry_items(authorization: str = Header(None)):
     require_admin(authorization)
     
     try:
-        with get_db_session() as session:
+        with get_db_read_session() as session:
             result = session.execute(text('''
                 SELECT p.user_id, p.ingredient_id, p.quantity, p.expiration_date, p.updated_at,
                        i.name as ingredient_name, 
@@ -22,7 +22,7 @@ def get_current_user_dependency(authorization: str = Header(None)):
     
     try:
         # Extract token from "Bearer <token>"
-        token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
+        token = authorization[7:] if authorization.startswith("Bearer ") else authorization
         
         user = AuthService.verify_user_token(token)
         if not user:
@@ -52,7 +52,7 @@ def get_current_user(authorization: str = None):
     
     try:
         # Extract token from "Bearer <token>"
-        token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
+        token = authorization[7:] if authorization.startswith("Bearer ") else authorization
         
         user = AuthService.verify_user_token(token)
         if not user:
@@ -78,7 +78,7 @@ async def register(user_data: UserCreate):
     """Register a new user"""
     logger.info(f"🔐 REGISTRATION ATTEMPT - Email: {user_data.email}")
     
-    result = AuthService.register_user(user_data.email, user_data.name, user_data.password)
+    result = await AuthService.register_user_async(user_data.email, user_data.name, user_data.password)
     
     if not result:
         logger.warning(f"❌ REGISTRATION FAILED - Email already exists: {user_data.email}")
@@ -98,7 +98,7 @@ async def login(user_data: UserLogin):
     """Authenticate user and return tokens"""
     logger.info(f"🔐 LOGIN ATTEMPT - Email: {user_data.email}")
     
-    result = AuthService.login_user(user_data.email, user_data.password)
+    result = await AuthService.login_user_async(user_data.email, user_data.password)
     
     if not result:
         logger.warning(f"❌ LOGIN FAILED - Invalid credentials: {user_data.email}")
@@ -5,10 +5,10 @@ import logging
 import uuid
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Header, Query, UploadFile, File
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer, undefer_group
 from sqlalchemy import desc, or_, and_
 
-from ..db.database import get_db
+from ..db.database import get_db, dialect_insert, TS_NOW
 from ..core.auth_service import AuthService
 from ..models.content import Book
 from ..schemas.books import (
@@ -125,7 +125,8 @@ def list_books(
         logger.info(f"📚 Fetching books for user: {user_uuid}")
         
         # Build query
-        query = db.query(Book).filter(Book.user_id == user_uuid)
+        # The response includes the deferred description/user_notes
+        query = db.query(Book).options(undefer_group("details")).filter(Book.user_id == user_uuid)
         
         # Apply filters
         if reading_status:
@@ -159,32 +160,8 @@ def list_books(
         logger.info(f"📚 Found {len(books)} books (page {page}/{total_pages}, total: {total})")
         
         # Convert to response format
-        book_responses = [
-            BookResponse(
-                id=str(book.id),
-                user_id=str(book.user_id),
-                title=book.title,
-                author=book.author,
-                description=book.description,
-                genre=book.genre,
-                isbn=book.isbn,
-                pages=book.pages,
-                publication_year=book.publication_year,
-                cover_image_url=book.cover_image_url,
-                google_books_id=book.google_books_id,
-                open_library_id=book.open_library_id,
-                current_page=book.current_page,
-                reading_status=book.reading_status,
-                date_started=book.date_started,
-                date_finished=book.date_finished,
-                user_notes=book.user_notes,
-                is_favorite=book.is_favorite,
-                source=book.source,
-                created_at=book.created_at,
-                updated_at=book.updated_at
-            )
-            for book in books
-        ]
+        # Rows were validated on the way in, so skip re-validating them on the way out
+        book_responses = [BookResponse.from_orm_trusted(book) for book in books]
         
         return BookListResponse(
             books=book_responses,
@@ -210,7 +187,7 @@ def get_book(
         user_uuid = uuid.UUID(current_user["id"])
         book_uuid = uuid.UUID(book_id)
         
-        book = db.query(Book).filter(
+        book = db.query(Book).options(undefer_group("details")).filter(
             Book.id == book_uuid,
             Book.user_id == user_uuid
         ).first()
@@ -720,28 +697,24 @@ def rate_book(
         if not book:
             raise HTTPException(status_code=404, detail="Book not found")
         
-        # Check if user already rated this book
+        # Insert the rating, or update the user's existing one, in a single statement
         from ..models.content import ContentRating, ContentType
-        existing_rating = db.query(ContentRating).filter(
-            ContentRating.user_id == user_uuid,
-            ContentRating.book_id == book_uuid
-        ).first()
-        
-        if existing_rating:
-            # Update existing rating
-            existing_rating.rating = rating
-            existing_rating.review_text = review_text
-        else:
-            # Create new rating
-            new_rating = ContentRating(
-                user_id=user_uuid,
-                book_id=book_uuid,
-                content_type=ContentType.BOOK,
-                rating=rating,
-                review_text=review_text
-            )
-            db.add(new_rating)
-        
+        stmt = dialect_insert(db, ContentRating).values(
+            user_id=user_uuid,
+            book_id=book_uuid,
+            content_type=ContentType.BOOK,
+            rating=rating,
+            review_text=review_text
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "content_type", "content_id"],
+            set_={
+                "rating": stmt.excluded.rating,
+                "review_text": stmt.excluded.review_text,
+                "updated_at": TS_NOW
+            }
+        )
+        db.execute(stmt)
         db.commit()
         
         logger.info(f"⭐ Book rated: {book.title} - {rating} stars")
@@ -767,7 +740,7 @@ def get_book_rating(
         book_uuid = uuid.UUID(book_id)
         
         from ..models.content import ContentRating
-        rating = db.query(ContentRating).filter(
+        rating = db.query(ContentRating).options(undefer(ContentRating.review_text)).filter(
             ContentRating.user_id == user_uuid,
             ContentRating.book_id == book_uuid
         ).first()
@@ -7,7 +7,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Header, Depends
 from pydantic import BaseModel
 
-from ..core.database_service import get_db_session, db_service
+from ..core.database_service import get_db_session, get_db_read_session
 from ..core.auth_service import AuthService
 from ..models.family import FamilyMember
 from ..schemas.family import FamilyMemberCreate, FamilyMemberUpdate, FamilyMemberResponse
@@ -67,7 +67,7 @@ async def get_family_members(authorization: str = Header(None)):
     if not current_user:
         return []
     
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         if current_user.get("is_admin", False):
             # Admin can see all family members
             family_members = session.query(FamilyMember).order_by(FamilyMember.created_at.desc()).all()
@@ -3,39 +3,42 @@ Ingredients API endpoints
 """
 import json
 from typing import List
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from ..core.database_service import get_db_session, db_service
+from ..db.database import get_async_db
 from ..schemas.pantry import IngredientResponse
-from ..models.ingredient import Ingredient
+from ..models.ingredient import Ingredient, IngredientCategory
 
 router = APIRouter(prefix="/ingredients", tags=["ingredients"])
 
 
 @router.get("", response_model=List[IngredientResponse])
-async def get_ingredients():
+async def get_ingredients(session: AsyncSession = Depends(get_async_db)):
     """Get all available ingredients"""
     try:
-        with get_db_session() as session:
-            from sqlalchemy.orm import joinedload
-            ingredients = session.query(Ingredient).options(joinedload(Ingredient.category)).all()
-            
-            result = []
-            for ingredient in ingredients:
-                result.append(IngredientResponse(
-                    id=str(ingredient.id),
-                    name=ingredient.name,
-                    category=ingredient.category.name if ingredient.category else "Other",
-                    unit=ingredient.unit,
-                    calories_per_unit=ingredient.nutritional_info.get("calories", 0) if ingredient.nutritional_info else 0,
-                    protein_per_unit=ingredient.nutritional_info.get("protein", 0) if ingredient.nutritional_info else 0,
-                    carbs_per_unit=ingredient.nutritional_info.get("carbs", 0) if ingredient.nutritional_info else 0,
-                    fat_per_unit=ingredient.nutritional_info.get("fat", 0) if ingredient.nutritional_info else 0,
-                    allergens=ingredient.allergens or [],
-                    created_at=None  # Not available in new model
-                ))
-            
-            return result
+        ingredients = (await session.execute(
+            select(Ingredient).options(joinedload(Ingredient.category))
+        )).scalars().all()
+        
+        result = []
+        for ingredient in ingredients:
+            result.append(IngredientResponse(
+                id=str(ingredient.id),
+                name=ingredient.name,
+                category=ingredient.category.name if ingredient.category else "Other",
+                unit=ingredient.unit,
+                calories_per_unit=ingredient.nutritional_info.get("calories", 0) if ingredient.nutritional_info else 0,
+                protein_per_unit=ingredient.nutritional_info.get("protein", 0) if ingredient.nutritional_info else 0,
+                carbs_per_unit=ingredient.nutritional_info.get("carbs", 0) if ingredient.nutritional_info else 0,
+                fat_per_unit=ingredient.nutritional_info.get("fat", 0) if ingredient.nutritional_info else 0,
+                allergens=ingredient.allergens or [],
+                created_at=None  # Not available in new model
+            ))
+        
+        return result
     except Exception as e:
         import logging
         logger = logging.getLogger(__name__)
@@ -44,74 +47,74 @@ async def get_ingredients():
 
 
 @router.get("/search", response_model=List[IngredientResponse])
-async def search_ingredients(q: str = Query(..., description="Search query for ingredient name or category")):
+async def search_ingredients(
+    q: str = Query(..., description="Search query for ingredient name or category"),
+    session: AsyncSession = Depends(get_async_db)
+):
     """Search ingredients by name or category"""
     try:
-        with get_db_session() as session:
-            from sqlalchemy.orm import joinedload
-            from sqlalchemy import or_
-            from ..models.ingredient import IngredientCategory
-            
-            # Enhanced search: ingredient name OR category name
-            # Also handle common search terms like "meat", "protein", etc.
-            search_term = q.lower().strip()
-            
-            # Map common search terms to multiple categories
-            category_mappings = {
-                "meat": ["Meat & Poultry"],
-                "protein": ["Meat & Poultry", "Fish & Seafood", "Legumes & Plant Proteins", "Eggs & Dairy Proteins"],
-                "proteins": ["Meat & Poultry", "Fish & Seafood", "Legumes & Plant Proteins", "Eggs & Dairy Proteins"],
-                "fish": ["Fish & Seafood"],
-                "seafood": ["Fish & Seafood"],
-                "dairy": ["Dairy", "Eggs & Dairy Proteins"],
-                "vegetables": ["Vegetables"],
-                "fruits": ["Fruits"],
-                "grains": ["Grains & Starches"],
-                "nuts": ["Nuts & Seeds"],
-                "seeds": ["Nuts & Seeds"],
-                "spices": ["Herbs & Spices"],
-                "herbs": ["Herbs & Spices"],
-                "oils": ["Oils & Condiments"],
-                "condiments": ["Oils & Condiments"]
-            }
-            
-            # Start with name-based search
-            query_conditions = [Ingredient.name.ilike(f'%{q}%')]
-            
-            # Add category-based search conditions
-            if search_term in category_mappings:
-                # Search across multiple related categories
-                category_names = category_mappings[search_term]
-                for cat_name in category_names:
-                    query_conditions.append(
-                        Ingredient.category.has(IngredientCategory.name.ilike(f'%{cat_name}%'))
-                    )
-            else:
-                # Direct category name search
+        # Enhanced search: ingredient name OR category name
+        # Also handle common search terms like "meat", "protein", etc.
+        search_term = q.lower().strip()
+        
+        # Map common search terms to multiple categories
+        category_mappings = {
+            "meat": ["Meat & Poultry"],
+            "protein": ["Meat & Poultry", "Fish & Seafood", "Legumes & Plant Proteins", "Eggs & Dairy Proteins"],
+            "proteins": ["Meat & Poultry", "Fish & Seafood", "Legumes & Plant Proteins", "Eggs & Dairy Proteins"],
+            "fish": ["Fish & Seafood"],
+            "seafood": ["Fish & Seafood"],
+            "dairy": ["Dairy", "Eggs & Dairy Proteins"],
+            "vegetables": ["Vegetables"],
+            "fruits": ["Fruits"],
+            "grains": ["Grains & Starches"],
+            "nuts": ["Nuts & Seeds"],
+            "seeds": ["Nuts & Seeds"],
+            "spices": ["Herbs & Spices"],
+            "herbs": ["Herbs & Spices"],
+            "oils": ["Oils & Condiments"],
+            "condiments": ["Oils & Condiments"]
+        }
+        
+        # Start with name-based search
+        query_conditions = [Ingredient.name.ilike(f'%{q}%')]
+        
+        # Add category-based search conditions
+        if search_term in category_mappings:
+            # Search across multiple related categories
+            category_names = category_mappings[search_term]
+            for cat_name in category_names:
                 query_conditions.append(
-                    Ingredient.category.has(IngredientCategory.name.ilike(f'%{q}%'))
+                    Ingredient.category.has(IngredientCategory.name.ilike(f'%{cat_name}%'))
                 )
-            
-            ingredients = session.query(Ingredient).options(joinedload(Ingredient.category)).filter(
+        else:
+            # Direct category name search
+            query_conditions.append(
+                Ingredient.category.has(IngredientCategory.name.ilike(f'%{q}%'))
+            )
+        
+        ingredients = (await session.execute(
+            select(Ingredient).options(joinedload(Ingredient.category)).where(
                 or_(*query_conditions)
-            ).limit(50).all()  # Increased limit for category searches
-            
-            result = []
-            for ingredient in ingredients:
-                result.append(IngredientResponse(
-                    id=str(ingredient.id),
-                    name=ingredient.name,
-                    category=ingredient.category.name if ingredient.category else "Other",
-                    unit=ingredient.unit,
-                    calories_per_unit=ingredient.nutritional_info.get("calories", 0) if ingredient.nutritional_info else 0,
-                    protein_per_unit=ingredient.nutritional_info.get("protein", 0) if ingredient.nutritional_info else 0,
-                    carbs_per_unit=ingredient.nutritional_info.get("carbs", 0) if ingredient.nutritional_info else 0,
-                    fat_per_unit=ingredient.nutritional_info.get("fat", 0) if ingredient.nutritional_info else 0,
-                    allergens=ingredient.allergens or [],
-                    created_at=None  # Not available in new model
-                ))
-            
-            return result
+            ).limit(50)  # Increased limit for category searches
+        )).scalars().all()
+        
+        result = []
+        for ingredient in ingredients:
+            result.append(IngredientResponse(
+                id=str(ingredient.id),
+                name=ingredient.name,
+                category=ingredient.category.name if ingredient.category else "Other",
+                unit=ingredient.unit,
+                calories_per_unit=ingredient.nutritional_info.get("calories", 0) if ingredient.nutritional_info else 0,
+                protein_per_unit=ingredient.nutritional_info.get("protein", 0) if ingredient.nutritional_info else 0,
+                carbs_per_unit=ingredient.nutritional_info.get("carbs", 0) if ingredient.nutritional_info else 0,
+                fat_per_unit=ingredient.nutritional_info.get("fat", 0) if ingredient.nutritional_info else 0,
+                allergens=ingredient.allergens or [],
+                created_at=None  # Not available in new model
+            ))
+        
+        return result
     except Exception as e:
         import logging
         logger = logging.getLogger(__name__)
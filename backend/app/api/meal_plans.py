@@ -6,7 +6,7 @@ import json
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Header, Query
 
-from ..core.database_service import get_db_session
+from ..core.database_service import get_db_session, get_db_read_session
 from ..core.auth_service import AuthService
 from ..schemas.meals import (
     MealPlanCreate, 
@@ -56,7 +56,7 @@ async def get_meal_plans(
     if not current_user:
         raise HTTPException(status_code=401, detail="Authentication required")
     
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         from sqlalchemy import text
         
         user_id = current_user['sub']
@@ -143,10 +143,12 @@ async def create_meal_plan(
         # Insert new meal plan
         recipe_data_str = json.dumps(meal_plan_data.recipe_data) if meal_plan_data.recipe_data else None
         
-        session.execute(text('''
+        # RETURNING hands back the row with its server-side created_at, no follow-up SELECT
+        result = session.execute(text('''
             INSERT INTO meal_plans 
             (id, user_id, date, meal_type, meal_name, meal_description, recipe_data, ai_generated, ai_provider)
             VALUES (:id, :user_id, :date, :meal_type, :meal_name, :meal_description, :recipe_data, :ai_generated, :ai_provider)
+            RETURNING id, user_id, date, meal_type, meal_name, meal_description, recipe_data, ai_generated, ai_provider, created_at
         '''), {
             'id': meal_plan_id,
             'user_id': user_id,
@@ -158,12 +160,6 @@ async def create_meal_plan(
             'ai_generated': meal_plan_data.ai_generated,
             'ai_provider': meal_plan_data.ai_provider
         })
-        
-        # Get the created meal plan
-        result = session.execute(text('''
-            SELECT id, user_id, date, meal_type, meal_name, meal_description, recipe_data, ai_generated, ai_provider, created_at
-            FROM meal_plans WHERE id = :meal_plan_id
-        '''), {'meal_plan_id': meal_plan_id})
         meal_plan = result.fetchone()
         
         if not meal_plan:
@@ -299,7 +295,7 @@ async def delete_meal_plan(
 @router.get("/{meal_plan_id}/reviews", response_model=List[MealReviewResponse])
 async def get_meal_reviews(meal_plan_id: str):
     """Get reviews for a specific meal plan"""
-    with get_db_session() as session:
+    with get_db_read_session() as session:
         from sqlalchemy import text
         
         # Check if meal_reviews table exists (PostgreSQL compatible)
@@ -375,11 +371,13 @@ async def create_meal_review(
         
         review_id = str(uuid.uuid4())
         
-        # Insert new review
-        session.execute(text('''
+        # Insert new review; RETURNING includes the server-side reviewed_at
+        result = session.execute(text('''
             INSERT INTO meal_reviews 
             (id, meal_plan_id, user_id, rating, review_text, would_make_again, preparation_notes)
             VALUES (:id, :meal_plan_id, :user_id, :rating, :review_text, :would_make_again, :preparation_notes)
+            RETURNING id, meal_plan_id, user_id, rating, review_text,
+                      would_make_again, preparation_notes, reviewed_at
         '''), {
             "id": review_id,
             "meal_plan_id": meal_plan_id,
@@ -389,15 +387,8 @@ async def create_meal_review(
             "would_make_again": review_data.would_make_again,
             "preparation_notes": review_data.preparation_notes
         })
-        session.commit()
-        
-        # Get the created review
-        result = session.execute(text('''
-            SELECT id, meal_plan_id, user_id, rating, review_text, 
-                   would_make_again, preparation_notes, reviewed_at
-            FROM meal_reviews WHERE id = :review_id
-        '''), {"review_id": review_id})
         review = result.fetchone()
+        session.commit()
         
         if not review:
             raise HTTPException(status_code=500, detail="Failed to create review")
@@ -48,9 +48,9 @@ async def migrate_recipes_v2():
                             prep_time INTEGER NOT NULL,
                             difficulty VARCHAR(50) NOT NULL,
                             servings INTEGER NOT NULL,
-                            ingredients_needed JSON NOT NULL DEFAULT '[]',
-                            instructions JSON NOT NULL DEFAULT '[]',
-                            tags JSON NOT NULL DEFAULT '[]',
+                            ingredients_needed JSONB NOT NULL DEFAULT '[]',
+                            instructions JSONB NOT NULL DEFAULT '[]',
+                            tags JSONB NOT NULL DEFAULT '[]',
                             nutrition_notes TEXT DEFAULT '',
                             pantry_usage_score INTEGER DEFAULT 0,
                             source VARCHAR(100) DEFAULT 'user_created',
@@ -88,9 +88,9 @@ async def migrate_recipes_v2():
                                 prep_time INTEGER NOT NULL,
                                 difficulty VARCHAR(50) NOT NULL,
                                 servings INTEGER NOT NULL,
-                                ingredients_needed JSON NOT NULL DEFAULT '[]',
-                                instructions JSON NOT NULL DEFAULT '[]',
-                                tags JSON NOT NULL DEFAULT '[]',
+                                ingredients_needed JSONB NOT NULL DEFAULT '[]',
+                                instructions JSONB NOT NULL DEFAULT '[]',
+                                tags JSONB NOT NULL DEFAULT '[]',
                                 nutrition_notes TEXT DEFAULT '',
                                 pantry_usage_score INTEGER DEFAULT 0,
                                 source VARCHAR(100) DEFAULT 'user_created',
@@ -5,7 +5,7 @@ import logging
 import uuid
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Header, Query, UploadFile, File
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from sqlalchemy import desc, or_, and_
 
 from ..db.database import get_db
@@ -120,7 +120,8 @@ def list_movies(
         logger.info(f"🎬 Fetching movies for user: {user_uuid}")
         
         # Build query
-        query = db.query(Movie).filter(Movie.user_id == user_uuid)
+        # The response includes the deferred description/user_notes
+        query = db.query(Movie).options(undefer_group("details")).filter(Movie.user_id == user_uuid)
         
         # Apply filters
         if viewing_status:
@@ -154,30 +155,8 @@ def list_movies(
         logger.info(f"🎬 Found {len(movies)} movies (page {page}/{total_pages}, total: {total})")
         
         # Convert to response format
-        movie_responses = [
-            MovieResponse(
-                id=str(movie.id),
-                user_id=str(movie.user_id),
-                title=movie.title,
-                description=movie.description,
-                genre=movie.genre,
-                director=movie.director,
-                release_year=movie.release_year,
-                runtime=movie.runtime,
-                poster_image_url=movie.poster_image_url,
-                tmdb_id=movie.tmdb_id,
-                imdb_id=movie.imdb_id,
-                omdb_id=movie.omdb_id,
-                viewing_status=movie.viewing_status,
-                date_watched=movie.date_watched,
-                user_notes=movie.user_notes,
-                is_favorite=movie.is_favorite,
-                source=movie.source,
-                created_at=movie.created_at,
-                updated_at=movie.updated_at
-            )
-            for movie in movies
-        ]
+        # Rows were validated on the way in, so skip re-validating them on the way out
+        movie_responses = [MovieResponse.from_orm_trusted(movie) for movie in movies]
         
         return MovieListResponse(
             movies=movie_responses,
@@ -203,7 +182,7 @@ def get_movie(
         user_uuid = uuid.UUID(current_user["id"])
         movie_uuid = uuid.UUID(movie_id)
         
-        movie = db.query(Movie).filter(
+        movie = db.query(Movie).options(undefer_group("details")).filter(
             Movie.id == movie_uuid,
             Movie.user_id == user_uuid
         ).first()
@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException, Header, Depends, Query
 
 from ..utils.validation import validate_uuid_or_raise, is_valid_uuid
 
-from ..core.database_service import get_db_session, db_service
+from ..core.database_service import get_db_session
 from ..core.auth_service import AuthService
 from ..models.ingredient import Ingredient, PantryItem
 from ..models.user import User
@@ -3,10 +3,10 @@ RecipeV2 API - Ultra simple, no complexity
 """
 import logging
 import uuid
-from typing import List
+from typing import Dict, Iterable, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Header
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, undefer_group
+from sqlalchemy import desc, func
 
 from ..db.database import get_db
 from ..core.auth_service import AuthService
@@ -19,13 +19,20 @@ router = APIRouter(tags=["recipes"])
 logger = logging.getLogger(__name__)
 
 
-def calculate_average_rating(db: Session, recipe_id: uuid.UUID) -> float:
+def calculate_average_ratings(db: Session, recipe_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, float]:
+    """Average rating per recipe in one GROUP BY query; unrated recipes are left out"""
+    recipe_ids = list(recipe_ids)
+    if not recipe_ids:
+        return {}
+    rows = db.query(RecipeRating.recipe_id, func.avg(RecipeRating.rating)).filter(
+        RecipeRating.recipe_id.in_(recipe_ids)
+    ).group_by(RecipeRating.recipe_id).all()
+    return {recipe_id: round(float(average), 1) for recipe_id, average in rows}
+
+
+def calculate_average_rating(db: Session, recipe_id: uuid.UUID) -> Optional[float]:
     """Calculate average rating for a recipe"""
-    ratings = db.query(RecipeRating).filter(RecipeRating.recipe_id == recipe_id).all()
-    if not ratings:
-        return None
-    total = sum(r.rating for r in ratings)
-    return round(total / len(ratings), 1)
+    return calculate_average_ratings(db, [recipe_id]).get(recipe_id)
 
 
 def get_current_user_simple(authorization: str = Header(None)):
@@ -143,8 +150,8 @@ def list_recipes(
         user_uuid = uuid.UUID(current_user["id"])
         logger.info(f"📋 Fetching recipes for user: {user_uuid}")
         
-        # Get recipes for user
-        recipes = db.query(RecipeV2).filter(
+        # Get recipes for user (with the deferred ingredients/instructions/tags the response needs)
+        recipes = db.query(RecipeV2).options(undefer_group("details")).filter(
             RecipeV2.user_id == user_uuid
         ).order_by(desc(RecipeV2.created_at)).all()
         
@@ -152,31 +159,15 @@ def list_recipes(
         if recipes:
             logger.info(f"📋 Sample recipe IDs: {[str(r.id) for r in recipes[:3]]}")
         
+        average_ratings = calculate_average_ratings(db, (recipe.id for recipe in recipes))
+        
         # Convert to response format (simplified like production)
         response_recipes = []
         for recipe in recipes:
             try:
-                ingredients_needed = [IngredientNeeded(**ingredient) for ingredient in recipe.ingredients_needed]
-                response_recipes.append(RecipeV2Response(
-                    id=str(recipe.id),
-                    user_id=str(recipe.user_id),
-                    name=recipe.name,
-                    description=recipe.description,
-                    prep_time=recipe.prep_time,
-                    difficulty=recipe.difficulty,
-                    servings=recipe.servings,
-                    ingredients_needed=ingredients_needed,
-                    instructions=recipe.instructions,
-                    tags=recipe.tags,
-                    nutrition_notes=recipe.nutrition_notes,
-                    pantry_usage_score=recipe.pantry_usage_score,
-                    source=recipe.source,
-                    ai_generated=recipe.ai_generated,
-                    ai_provider=recipe.ai_provider,
-                    rating=None,  # Temporarily disable rating calculation
-                    created_at=recipe.created_at.isoformat(),
-                    updated_at=recipe.updated_at.isoformat()
-                ))
+                response_recipes.append(
+                    RecipeV2Response.from_orm_trusted(recipe, rating=average_ratings.get(recipe.id))
+                )
                 logger.info(f"✅ Successfully processed recipe {recipe.id}: {recipe.name}")
             except Exception as recipe_error:
                 logger.error(f"❌ Error processing recipe {recipe.id}: {recipe_error}")
@@ -203,7 +194,7 @@ def get_recipe(
         recipe_uuid = uuid.UUID(recipe_id)
         
         # Get recipe
-        recipe = db.query(RecipeV2).filter(
+        recipe = db.query(RecipeV2).options(undefer_group("details")).filter(
             RecipeV2.id == recipe_uuid,
             RecipeV2.user_id == user_uuid
         ).first()
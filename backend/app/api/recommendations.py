@@ -7,7 +7,7 @@ import json
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Header, Query
 
-from ..core.database_service import get_db_session, db_service
+from ..core.database_service import get_db_session
 from ..core.auth_service import AuthService
 from ..schemas.meals import MealRecommendationRequest, MealRecommendationResponse
 
@@ -151,10 +151,9 @@ async def get_meal_recommendations(
         logger.info(f"🔥 Found {len(family_data)} family members")
         for i, member in enumerate(family_data):
             logger.info(f"🔥 Processing family member {i+1}: {member}")
-            # Parse preferences from JSON and extract dietary restrictions if available
+            # jsonb arrives as a dict; a family_members table not yet converted holds JSON text
             try:
                 preferences = member[3] if isinstance(member[3], dict) else (json.loads(member[3]) if member[3] else {})
-                logger.info(f"🔥 Parsed preferences: {preferences}")
             except (json.JSONDecodeError, TypeError) as e:
                 logger.warning(f"🔥 JSON parse failed for preferences: {e} - returning empty dict")
                 preferences = {}
@@ -188,9 +187,9 @@ async def get_meal_recommendations(
             pantry_data = result.fetchall()
             logger.info(f"🔥 Found {len(pantry_data)} pantry items")
             for item in pantry_data:
-                # Parse nutritional info from JSON
+                # jsonb arrives as a dict; an ingredients table not yet converted may hold JSON text
                 try:
-                    nutritional_info = json.loads(item[6]) if item[6] else {}
+                    nutritional_info = item[6] if isinstance(item[6], dict) else (json.loads(item[6]) if item[6] else {})
                 except (json.JSONDecodeError, TypeError):
                     logger.warning(f"Failed to parse nutritional info for item {item[3]} - using empty dict")
                     nutritional_info = {}
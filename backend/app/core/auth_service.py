@@ -1,12 +1,16 @@
 """
 Authentication service for PostgreSQL
 """
+import asyncio
 import logging
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
-from .database_service import get_db_session
-from .security import verify_password, hash_password, create_access_token, verify_token
+from .database_service import get_db_session, get_db_read_session
+from .security import (
+    verify_password, hash_password, verify_password_async, hash_password_async,
+    password_needs_rehash, migrate_legacy_password_hash, create_access_token, verify_token
+)
 from ..models.user import User
 
 logger = logging.getLogger(__name__)
@@ -16,27 +20,30 @@ class AuthService:
     """Authentication service for PostgreSQL"""
     
     @staticmethod
-    def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
-        """Get user by email using PostgreSQL"""
-        with get_db_session() as session:
-            user = session.query(User).filter(User.email == email).first()
-            if user:
-                return {
-                    "id": str(user.id),  # Convert UUID to string
-                    "email": user.email,
-                    "name": user.name,
-                    "hashed_password": user.hashed_password,
-                    "timezone": user.timezone,
-                    "is_active": user.is_active,
-                    "is_admin": user.is_admin,
-                    "created_at": user.created_at
-                }
-            return None
+    def get_user_by_email(email: str, session: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        """Get user by email using PostgreSQL (reuses ``session`` when given)"""
+        if session is None:
+            with get_db_read_session() as session:
+                return AuthService.get_user_by_email(email, session)
+        
+        user = session.query(User).filter(User.email == email).first()
+        if user:
+            return {
+                "id": str(user.id),  # Convert UUID to string
+                "email": user.email,
+                "name": user.name,
+                "hashed_password": user.hashed_password,
+                "timezone": user.timezone,
+                "is_active": user.is_active,
+                "is_admin": user.is_admin,
+                "created_at": user.created_at
+            }
+        return None
     
     @staticmethod
     def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID using PostgreSQL"""
-        with get_db_session() as session:
+        with get_db_read_session() as session:
             user = session.query(User).filter(User.id == user_id).first()
             if user:
                 return {
@@ -52,35 +59,40 @@ class AuthService:
             return None
     
     @staticmethod
-    def create_user(email: str, name: str, password: str, is_admin: bool = False) -> Optional[Dict[str, Any]]:
-        """Create a new user"""
-        with get_db_session() as session:
-            # Check if user already exists
-            existing_user = session.query(User).filter(User.email == email).first()
-            if existing_user:
-                return None
-            
-            # Create new user
-            import uuid
-            new_user = User(
-                id=uuid.uuid4(),
-                email=email,
-                name=name,
-                hashed_password=hash_password(password),
-                is_active=True,
-                is_admin=is_admin
-            )
-            session.add(new_user)
-            session.commit()
-            
-            return {
-                "id": str(new_user.id),
-                "email": new_user.email,
-                "name": new_user.name,
-                "is_active": new_user.is_active,
-                "is_admin": new_user.is_admin,
-                "created_at": new_user.created_at
-            }
+    def create_user(email: str, name: str, password: str, is_admin: bool = False,
+                    session: Optional[Session] = None,
+                    hashed_password: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Create a new user (reuses ``session`` when given; caller owns the commit)"""
+        if session is None:
+            with get_db_session() as session:
+                return AuthService.create_user(email, name, password, is_admin, session, hashed_password)
+        
+        # Check if user already exists
+        existing_user = session.query(User).filter(User.email == email).first()
+        if existing_user:
+            return None
+        
+        # Create new user
+        import uuid
+        new_user = User(
+            id=uuid.uuid4(),
+            email=email,
+            name=name,
+            hashed_password=hashed_password or hash_password(password),
+            is_active=True,
+            is_admin=is_admin
+        )
+        session.add(new_user)
+        session.flush()
+        
+        return {
+            "id": str(new_user.id),
+            "email": new_user.email,
+            "name": new_user.name,
+            "is_active": new_user.is_active,
+            "is_admin": new_user.is_admin,
+            "created_at": new_user.created_at
+        }
     
     @staticmethod
     def login_user(email: str, password: str) -> Optional[Dict[str, Any]]:
@@ -100,10 +112,42 @@ class AuthService:
             logger.warning(f"❌ Invalid password for: {email}")
             return None
         
-        # Create token
-        token = create_access_token({"sub": user["id"], "email": user["email"]})
+        # Upgrade legacy SHA-256 hashes and outdated bcrypt costs while we have the password
+        if password_needs_rehash(user["hashed_password"]):
+            migrate_legacy_password_hash(user["id"], password)
         
         logger.info(f"✅ Login successful for: {email}")
+        return AuthService._login_response(user)
+    
+    @staticmethod
+    async def login_user_async(email: str, password: str) -> Optional[Dict[str, Any]]:
+        """Authenticate user, verifying the password off the event loop"""
+        logger.info(f"🔐 Attempting login for: {email}")
+        
+        user = AuthService.get_user_by_email(email)
+        if not user:
+            logger.warning(f"❌ User not found: {email}")
+            return None
+        
+        if not user.get("is_active", False):
+            logger.warning(f"❌ User inactive: {email}")
+            return None
+        
+        if not await verify_password_async(password, user["hashed_password"]):
+            logger.warning(f"❌ Invalid password for: {email}")
+            return None
+        
+        # Upgrade legacy SHA-256 hashes and outdated bcrypt costs while we have the password
+        if password_needs_rehash(user["hashed_password"]):
+            await asyncio.to_thread(migrate_legacy_password_hash, user["id"], password)
+        
+        logger.info(f"✅ Login successful for: {email}")
+        return AuthService._login_response(user)
+    
+    @staticmethod
+    def _login_response(user: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a token and login payload for an authenticated user"""
+        token = create_access_token({"sub": user["id"], "email": user["email"]})
         return {
             "access_token": token,
             "token_type": "bearer",
@@ -125,6 +169,18 @@ class AuthService:
         # Automatically log in the new user
         return AuthService.login_user(email, password)
     
+    @staticmethod
+    async def register_user_async(email: str, name: str, password: str) -> Optional[Dict[str, Any]]:
+        """Register a new user, hashing the password off the event loop"""
+        hashed_password = await hash_password_async(password)
+        user = AuthService.create_user(email, name, password, is_admin=False, hashed_password=hashed_password)
+        if not user:
+            return None
+        
+        # The password was just hashed, so issue the token without re-verifying it
+        logger.info(f"✅ Login successful for: {email}")
+        return AuthService._login_response(user)
+    
     @staticmethod
     def verify_user_token(token: str) -> Optional[Dict[str, Any]]:
         """Verify token and return user data"""
@@ -30,9 +30,20 @@ class Settings:
         self.JWT_SECRET: str = os.getenv("JWT_SECRET")
         self.JWT_ALGORITHM: str = "HS256"
         self.JWT_EXPIRATION_HOURS: int = 24
+        # bcrypt cost factor; 10 is the OWASP minimum and ~4x cheaper than the library default of 12
+        self.BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "10"))
         
         # Database validation will be done in DATABASE_URL property
         
+        # Database connection pool (PostgreSQL)
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+        self.DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        # Separate, smaller pool for the asyncpg engine (only the ingredient endpoints use it)
+        self.DB_ASYNC_POOL_SIZE: int = int(os.getenv("DB_ASYNC_POOL_SIZE", "5"))
+        self.DB_ASYNC_MAX_OVERFLOW: int = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "5"))
+        
         # Validate critical security settings
         if not self.JWT_SECRET:
             # Allow fallback in development, test, and CI environments
@@ -61,6 +72,8 @@ class Settings:
             "https://food-planning-app-git-preview-sams-projects-c6bbe2f2.vercel.app",  # Old preview frontend (legacy)
             "https://*.vercel.app",  # Any Vercel preview deployment
         ]
+        # How long browsers may cache a CORS preflight response (seconds)
+        self.CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "86400"))
         
         # Claude AI
         self.ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
@@ -77,6 +90,10 @@ class Settings:
         
         # Debug mode
         self.DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+        
+        # Run startup migrations in each app process; set to false on replicas when a
+        # dedicated `python -m app.migrations.run_all` job applies them instead
+        self.RUN_MIGRATIONS: bool = os.getenv("RUN_MIGRATIONS", "true").lower() == "true"
     
     @property
     def DB_PATH(self) -> str:
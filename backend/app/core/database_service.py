@@ -1,20 +1,28 @@
 """
 Unified database service layer supporting both SQLite and PostgreSQL
 """
+import csv
+import io
+import json
 import logging
 import os
+import uuid
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, Any, Dict, List
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from .config import get_settings
-from ..db.database import Base, get_db  # SQLAlchemy setup
+from ..db.database import Base, get_db, get_engine, get_session_factory, get_read_session_factory  # SQLAlchemy setup
 from .. import models  # Import all models so Base.metadata knows about them
 
 logger = logging.getLogger(__name__)
 
+# Static statements parsed once instead of on every call
+_PING = text("SELECT 1")
+
 
 class DatabaseService:
     """Database service using SQLAlchemy (supports SQLite and PostgreSQL)"""
@@ -22,27 +30,11 @@ class DatabaseService:
     def __init__(self):
         self.settings = get_settings()
         
-        # Initialize SQLAlchemy engine
-        connect_args = {}
-        engine_kwargs = {
-            "echo": False  # Set to True for SQL logging
-        }
-        
-        if self.settings.DATABASE_URL.startswith("sqlite"):
-            connect_args = {"check_same_thread": False}
-        else:
-            engine_kwargs.update({
-                "pool_pre_ping": True,
-                "pool_recycle": 300
-            })
-        
-        self.engine = create_engine(
-            self.settings.DATABASE_URL,
-            connect_args=connect_args,
-            **engine_kwargs
-        )
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
-        logger.info(f"📊 Database service initialized: {self.settings.DATABASE_URL}")
+        # Reuse the application engine rather than opening a second pool to the same database
+        self.engine = get_engine()
+        self.SessionLocal = get_session_factory()
+        self.ReadSessionLocal = get_read_session_factory()
+        logger.info("📊 Database service initialized: %s", self.settings.DATABASE_URL)
     
     @contextmanager
     def get_session(self):
@@ -53,104 +45,158 @@ class DatabaseService:
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"Database session error: {e}")
+            logger.error("Database session error: %s", e)
+            raise
+        finally:
+            session.close()
+    
+    @contextmanager
+    def get_read_session(self):
+        """Get a session for reads: never committed, released on exit"""
+        session = self.ReadSessionLocal()
+        try:
+            yield session
+        except Exception as e:
+            logger.error("Database read session error: %s", e)
             raise
         finally:
+            # close() rolls back the open transaction instead of paying for a COMMIT
             session.close()
     
-    def create_tables(self):
-        """Create database tables"""
-        Base.metadata.create_all(bind=self.engine)
+    def create_tables(self, bind=None):
+        """Create database tables (on ``bind`` if given, e.g. an open session's connection)"""
+        Base.metadata.create_all(bind=bind if bind is not None else self.engine)
         logger.info("✅ Database tables created")
     
     def test_connection(self) -> bool:
         """Test database connection"""
         try:
             with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+                conn.execute(_PING)
             return True
         except Exception as e:
-            logger.error(f"Database connection test failed: {e}")
+            logger.error("Database connection test failed: %s", e)
             return False
 
 
-# Global database service instance
-db_service = DatabaseService()
+@lru_cache(maxsize=1)
+def get_db_service() -> DatabaseService:
+    """Get the shared database service, creating the engine on first use"""
+    return DatabaseService()
 
 
-@contextmanager
 def get_db_session():
     """Global function to get database session"""
-    with db_service.get_session() as session:
-        yield session
+    # Hand back the service's context manager directly rather than wrapping it in another generator
+    return get_db_service().get_session()
+
+
+def get_db_read_session():
+    """Global function to get a read-only database session"""
+    return get_db_service().get_read_session()
 
 
 def init_db():
     """Initialize database tables"""
-    db_service.create_tables()
-    
-    # Create admin user if it doesn't exist
+    # DDL, admin bootstrap and seeding share one session so startup is a single transaction
     from .auth_service import AuthService
-    admin_user = AuthService.get_user_by_email("admin")
-    if not admin_user:
-        logger.info("🔑 Creating admin user...")
-        admin_user = AuthService.create_user(
-            email="admin",
-            name="Admin User",
-            password="admin123",
-            is_admin=True
-        )
-        if admin_user:
-            logger.info("✅ Admin user created successfully")
+    with get_db_session() as session:
+        get_db_service().create_tables(bind=session.connection())
+        
+        admin_user = AuthService.get_user_by_email("admin", session=session)
+        if not admin_user:
+            logger.info("🔑 Creating admin user...")
+            admin_user = AuthService.create_user(
+                email="admin",
+                name="Admin User",
+                password="admin123",
+                is_admin=True,
+                session=session
+            )
+            if admin_user:
+                logger.info("✅ Admin user created successfully")
+            else:
+                logger.error("❌ Failed to create admin user")
         else:
-            logger.error("❌ Failed to create admin user")
-    else:
-        logger.info("✅ Admin user already exists")
-    
-    # Seed default data
-    _seed_default_data()
+            logger.info("✅ Admin user already exists")
+        
+        # Seed default data
+        _seed_default_data(session)
 
 
-def _seed_default_data():
+def _seed_default_data(session: Session):
     """Seed database with default ingredients and categories"""
+    from ..models.ingredient import IngredientCategory, Ingredient
+    from ..data.ingredients_data import INGREDIENT_CATEGORIES, INGREDIENTS_DATA
+    
     try:
-        with get_db_session() as session:
-            from ..models.ingredient import IngredientCategory, Ingredient
-            from ..data.ingredients_data import INGREDIENT_CATEGORIES, INGREDIENTS_DATA
-            
-            # Check if categories already exist
-            existing_categories = session.query(IngredientCategory).count()
-            if existing_categories > 0:
+        # Savepoint so a seeding failure doesn't discard the admin user
+        with session.begin_nested():
+            # Probe a single row instead of counting the whole table
+            if session.scalar(select(IngredientCategory.id).limit(1)) is not None:
                 logger.info("✅ Default ingredients already seeded")
                 return
             
             logger.info("🌱 Seeding default ingredient categories and ingredients...")
             
-            # Create categories using centralized data
-            category_objects = {}
-            for cat_name in INGREDIENT_CATEGORIES:
-                category = IngredientCategory(name=cat_name)
-                session.add(category)
-                session.flush()  # Get the ID
-                category_objects[cat_name] = category
+            # Create all categories in one INSERT ... RETURNING round-trip
+            result = session.execute(
+                insert(IngredientCategory).returning(IngredientCategory.id, IngredientCategory.name),
+                [{"name": cat_name} for cat_name in INGREDIENT_CATEGORIES]
+            )
+            category_ids = {row.name: row.id for row in result}
             
-            # Create ingredients using centralized data
-            for name, category_name, unit, nutrition in INGREDIENTS_DATA:
-                ingredient = Ingredient(
-                    name=name,
-                    category_id=category_objects[category_name].id,
-                    unit=unit,
-                    nutritional_info=nutrition,
-                    allergens=[]
-                )
-                session.add(ingredient)
+            # Create ingredients as plain mappings, bypassing per-object unit-of-work
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "name": name,
+                    "category_id": category_ids[category_name],
+                    "unit": unit,
+                    "nutritional_info": nutrition._asdict(),
+                    "allergens": []
+                }
+                for name, category_name, unit, nutrition in INGREDIENTS_DATA
+            ]
+            if session.get_bind().dialect.driver == "psycopg2":
+                _copy_ingredients(session, rows)
+            else:
+                # Core executemany hits the insertmanyvalues fast path (one statement per page)
+                session.execute(insert(Ingredient), rows)
             
-            logger.info(f"✅ Seeded {len(INGREDIENT_CATEGORIES)} categories and {len(INGREDIENTS_DATA)} ingredients")
+            logger.info("✅ Seeded %d categories and %d ingredients", len(INGREDIENT_CATEGORIES), len(INGREDIENTS_DATA))
             
     except Exception as e:
-        logger.error(f"❌ Error seeding default data: {e}")
+        logger.error("❌ Error seeding default data: %s", e)
+
+
+def _copy_ingredients(session: Session, rows: List[Dict[str, Any]]):
+    """Stream ingredient rows into PostgreSQL with a single COPY"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow((
+            row["id"],
+            row["name"],
+            row["category_id"],
+            row["unit"],
+            json.dumps(row["nutritional_info"]),
+            json.dumps(row["allergens"])
+        ))
+    buf.seek(0)
+    
+    # Same connection (and transaction) as the ORM session
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            "COPY ingredients (id, name, category_id, unit, nutritional_info, allergens) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buf
+        )
+    finally:
+        cursor.close()
 
 
 def test_db_connection() -> bool:
     """Test database connection"""
-    return db_service.test_connection()
\ No newline at end of file
+    return get_db_service().test_connection()
\ No newline at end of file
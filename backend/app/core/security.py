@@ -1,51 +1,89 @@
 """
 Security utilities for authentication and authorization
 """
+import asyncio
+import base64
+import binascii
 import bcrypt
+import hashlib
+import hmac
+import json
 import jwt
 import logging
-from datetime import datetime, timedelta
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional, Union
+from sqlalchemy import text
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Reused JWT codec and algorithm allow-list (the secret is still read per call)
+_jwt = jwt.PyJWT()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+_UPDATE_PASSWORD_HASH = text("UPDATE users SET hashed_password = :new_hash WHERE id = :user_id")
+
+# bcrypt is deliberately CPU-heavy; run it here so async handlers don't block the event loop
+_PASSWORD_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="password-hash")
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode('utf-8')
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash is legacy SHA-256 or uses a different bcrypt cost"""
+    if not hashed_password.startswith("$2"):
+        return True
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
     """Verify a password against its hash (supports bcrypt and legacy SHA-256)"""
-    try:
-        # Try bcrypt first (current standard)
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-    except Exception:
-        # Fallback: check if it's a legacy SHA-256 hash
+    # Dispatch on the stored format so legacy hashes never pay for a doomed bcrypt attempt
+    if hashed_password.startswith("$2"):
         try:
-            import hashlib
-            legacy_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
-            if legacy_hash == hashed_password:
-                logger.warning(f"User authenticated with legacy SHA-256 hash - should be migrated to bcrypt")
-                return True
+            return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
         except Exception as e:
             logger.error(f"Password verification error: {e}")
-        return False
+            return False
+    
+    # Legacy SHA-256 hex digest
+    legacy_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
+    if hmac.compare_digest(legacy_hash.encode('utf-8'), hashed_password.encode('utf-8')):
+        logger.warning("User authenticated with legacy SHA-256 hash - should be migrated to bcrypt")
+        return True
+    return False
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PASSWORD_POOL, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password on the password thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PASSWORD_POOL, verify_password, password, hashed_password)
 
 
 def migrate_legacy_password_hash(user_id: str, new_password: str) -> None:
-    """Migrate a user's password from legacy SHA-256 to bcrypt"""
+    """Re-hash a user's password with the current bcrypt settings (e.g. from legacy SHA-256)"""
     from .database_service import get_db_session
-    from sqlalchemy import text
     
     try:
         with get_db_session() as session:
             new_hash = hash_password(new_password)
-            session.execute(text(
-                "UPDATE users SET hashed_password = :new_hash WHERE id = :user_id"
-            ), {"new_hash": new_hash, "user_id": user_id})
+            session.execute(_UPDATE_PASSWORD_HASH, {"new_hash": new_hash, "user_id": user_id})
             
         logger.info(f"Successfully migrated password hash for user {user_id} to bcrypt")
     except Exception as e:
@@ -56,20 +94,69 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Create a JWT access token"""
     to_encode = data.copy()
     
+    # Integer epoch seconds are what ends up in the token; skip the datetime round-trip
+    now = time.time()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(now + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(hours=settings.JWT_EXPIRATION_HOURS)
+        expire = int(now + settings.JWT_EXPIRATION_HOURS * 3600)
+    
+    to_encode.update({"exp": expire, "iat": int(now)})
+    
+    return _jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment"""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hs256(token: str) -> dict:
+    """Verify an HS256 token with one stdlib (OpenSSL) HMAC call, skipping PyJWT's dispatch"""
+    try:
+        signing_input, _, signature_segment = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        header = json.loads(_b64url_decode(header_segment))
+        signature = _b64url_decode(signature_segment)
+    except (ValueError, binascii.Error) as e:
+        raise jwt.DecodeError(f"Invalid token segments: {e}")
+    
+    # Never let the token choose its own algorithm
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+    
+    expected = hmac.new(settings.JWT_SECRET.encode("utf-8"), signing_input.encode("utf-8"), hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    
+    try:
+        payload = json.loads(_b64url_decode(payload_segment))
+    except (ValueError, binascii.Error) as e:
+        raise jwt.DecodeError(f"Invalid payload: {e}")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload: must be a JSON object")
     
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
+    # Same registered-claim checks PyJWT applies (no leeway)
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        if claim in payload and not isinstance(payload[claim], (int, float)):
+            raise jwt.DecodeError(f"{claim} claim must be a number")
+    if "exp" in payload and payload["exp"] <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if "nbf" in payload and payload["nbf"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "iat" in payload and payload["iat"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
     
-    return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return payload
 
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify and decode a JWT token"""
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        if settings.JWT_ALGORITHM == "HS256":
+            return _decode_hs256(token)
+        payload = _jwt.decode(token, settings.JWT_SECRET, algorithms=_JWT_ALGORITHMS)
         return payload
     except jwt.ExpiredSignatureError:
         logger.warning("Token has expired")
@@ -81,10 +168,11 @@ def verify_token(token: str) -> Optional[dict]:
 
 def extract_token_from_header(authorization: str) -> Optional[str]:
     """Extract token from Authorization header"""
-    if not authorization:
+    # Shorter than "Bearer x" can't carry a token
+    if not authorization or len(authorization) < 8:
         return None
     
     if not authorization.startswith("Bearer "):
         return None
     
-    return authorization.replace("Bearer ", "")
\ No newline at end of file
+    return authorization[7:]
\ No newline at end of file
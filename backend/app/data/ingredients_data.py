@@ -3,6 +3,11 @@ Centralized ingredient data with improved categorization
 Single source of truth for all ingredient and category information
 """
 
+from collections import namedtuple
+
+# Per-ingredient nutrition; use ._asdict() where a JSON object is needed
+Macros = namedtuple("Macros", ("calories", "protein", "carbs", "fat"))
+
 # Improved category structure with protein subcategories
 INGREDIENT_CATEGORIES = [
     "Meat & Poultry",
@@ -22,210 +27,210 @@ INGREDIENT_CATEGORIES = [
 # Comprehensive ingredient data with standardized naming and no duplicates
 INGREDIENTS_DATA = [
     # Meat & Poultry
-    ("Chicken Breast", "Meat & Poultry", "grams", {"calories": 165, "protein": 31, "carbs": 0, "fat": 3.6}),
-    ("Chicken Thighs", "Meat & Poultry", "grams", {"calories": 209, "protein": 26, "carbs": 0, "fat": 11}),
-    ("Ground Beef", "Meat & Poultry", "grams", {"calories": 250, "protein": 26, "carbs": 0, "fat": 15}),
-    ("Ground Turkey", "Meat & Poultry", "grams", {"calories": 203, "protein": 27, "carbs": 0, "fat": 9}),
-    ("Pork Chops", "Meat & Poultry", "grams", {"calories": 231, "protein": 23, "carbs": 0, "fat": 14}),
-    ("Turkey Breast", "Meat & Poultry", "grams", {"calories": 135, "protein": 30, "carbs": 0, "fat": 1}),
-    ("Ham", "Meat & Poultry", "grams", {"calories": 145, "protein": 21, "carbs": 1, "fat": 6}),
-    ("Bacon", "Meat & Poultry", "slices", {"calories": 43, "protein": 3, "carbs": 0, "fat": 3}),
+    ("Chicken Breast", "Meat & Poultry", "grams", Macros(165, 31, 0, 3.6)),
+    ("Chicken Thighs", "Meat & Poultry", "grams", Macros(209, 26, 0, 11)),
+    ("Ground Beef", "Meat & Poultry", "grams", Macros(250, 26, 0, 15)),
+    ("Ground Turkey", "Meat & Poultry", "grams", Macros(203, 27, 0, 9)),
+    ("Pork Chops", "Meat & Poultry", "grams", Macros(231, 23, 0, 14)),
+    ("Turkey Breast", "Meat & Poultry", "grams", Macros(135, 30, 0, 1)),
+    ("Ham", "Meat & Poultry", "grams", Macros(145, 21, 1, 6)),
+    ("Bacon", "Meat & Poultry", "slices", Macros(43, 3, 0, 3)),
     
     # Fish & Seafood
-    ("Salmon", "Fish & Seafood", "grams", {"calories": 208, "protein": 20, "carbs": 0, "fat": 12}),
-    ("Tuna", "Fish & Seafood", "grams", {"calories": 144, "protein": 30, "carbs": 0, "fat": 1}),
-    ("Cod", "Fish & Seafood", "grams", {"calories": 105, "protein": 23, "carbs": 0, "fat": 1}),
-    ("Shrimp", "Fish & Seafood", "grams", {"calories": 99, "protein": 18, "carbs": 0, "fat": 1.4}),
-    ("Crab", "Fish & Seafood", "grams", {"calories": 97, "protein": 19, "carbs": 0, "fat": 1.5}),
+    ("Salmon", "Fish & Seafood", "grams", Macros(208, 20, 0, 12)),
+    ("Tuna", "Fish & Seafood", "grams", Macros(144, 30, 0, 1)),
+    ("Cod", "Fish & Seafood", "grams", Macros(105, 23, 0, 1)),
+    ("Shrimp", "Fish & Seafood", "grams", Macros(99, 18, 0, 1.4)),
+    ("Crab", "Fish & Seafood", "grams", Macros(97, 19, 0, 1.5)),
     
     # Legumes & Plant Proteins
-    ("Black Beans", "Legumes & Plant Proteins", "cups", {"calories": 227, "protein": 15, "carbs": 41, "fat": 1}),
-    ("Kidney Beans", "Legumes & Plant Proteins", "cups", {"calories": 225, "protein": 15, "carbs": 40, "fat": 1}),
-    ("Chickpeas", "Legumes & Plant Proteins", "cups", {"calories": 269, "protein": 15, "carbs": 45, "fat": 4}),
-    ("Lentils", "Legumes & Plant Proteins", "cups", {"calories": 230, "protein": 18, "carbs": 40, "fat": 1}),
-    ("Tofu", "Legumes & Plant Proteins", "grams", {"calories": 76, "protein": 8, "carbs": 2, "fat": 5}),
-    ("Tempeh", "Legumes & Plant Proteins", "grams", {"calories": 193, "protein": 19, "carbs": 9, "fat": 11}),
-    ("Protein Powder", "Legumes & Plant Proteins", "scoops", {"calories": 120, "protein": 25, "carbs": 3, "fat": 1}),
+    ("Black Beans", "Legumes & Plant Proteins", "cups", Macros(227, 15, 41, 1)),
+    ("Kidney Beans", "Legumes & Plant Proteins", "cups", Macros(225, 15, 40, 1)),
+    ("Chickpeas", "Legumes & Plant Proteins", "cups", Macros(269, 15, 45, 4)),
+    ("Lentils", "Legumes & Plant Proteins", "cups", Macros(230, 18, 40, 1)),
+    ("Tofu", "Legumes & Plant Proteins", "grams", Macros(76, 8, 2, 5)),
+    ("Tempeh", "Legumes & Plant Proteins", "grams", Macros(193, 19, 9, 11)),
+    ("Protein Powder", "Legumes & Plant Proteins", "scoops", Macros(120, 25, 3, 1)),
     
     # Eggs & Dairy Proteins
-    ("Eggs", "Eggs & Dairy Proteins", "pieces", {"calories": 70, "protein": 6, "carbs": 1, "fat": 5}),
-    ("Egg Whites", "Eggs & Dairy Proteins", "cups", {"calories": 126, "protein": 26, "carbs": 2, "fat": 0}),
-    ("Greek Yogurt", "Eggs & Dairy Proteins", "cups", {"calories": 100, "protein": 17, "carbs": 6, "fat": 0}),
-    ("Cottage Cheese", "Eggs & Dairy Proteins", "cups", {"calories": 163, "protein": 28, "carbs": 6, "fat": 2}),
+    ("Eggs", "Eggs & Dairy Proteins", "pieces", Macros(70, 6, 1, 5)),
+    ("Egg Whites", "Eggs & Dairy Proteins", "cups", Macros(126, 26, 2, 0)),
+    ("Greek Yogurt", "Eggs & Dairy Proteins", "cups", Macros(100, 17, 6, 0)),
+    ("Cottage Cheese", "Eggs & Dairy Proteins", "cups", Macros(163, 28, 6, 2)),
     
     # Vegetables  
-    ("Onion", "Vegetables", "pieces", {"calories": 40, "protein": 1, "carbs": 9, "fat": 0}),
-    ("Red Onion", "Vegetables", "pieces", {"calories": 40, "protein": 1, "carbs": 9, "fat": 0}),
-    ("Green Onions", "Vegetables", "cups", {"calories": 32, "protein": 2, "carbs": 7, "fat": 0}),
-    ("Garlic", "Vegetables", "cloves", {"calories": 4, "protein": 0.2, "carbs": 1, "fat": 0}),
-    ("Ginger", "Vegetables", "tablespoons", {"calories": 4, "protein": 0.1, "carbs": 1, "fat": 0}),
-    ("Bell Pepper", "Vegetables", "pieces", {"calories": 25, "protein": 1, "carbs": 6, "fat": 0}),
-    ("Red Bell Pepper", "Vegetables", "pieces", {"calories": 30, "protein": 1, "carbs": 7, "fat": 0}),
-    ("Jalapeño", "Vegetables", "pieces", {"calories": 4, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Broccoli", "Vegetables", "cups", {"calories": 25, "protein": 3, "carbs": 5, "fat": 0}),
-    ("Cauliflower", "Vegetables", "cups", {"calories": 25, "protein": 2, "carbs": 5, "fat": 0}),
-    ("Brussels Sprouts", "Vegetables", "cups", {"calories": 38, "protein": 3, "carbs": 8, "fat": 0}),
-    ("Cabbage", "Vegetables", "cups", {"calories": 22, "protein": 1, "carbs": 5, "fat": 0}),
-    ("Spinach", "Vegetables", "cups", {"calories": 7, "protein": 1, "carbs": 1, "fat": 0}),
-    ("Kale", "Vegetables", "cups", {"calories": 33, "protein": 2, "carbs": 7, "fat": 0}),
-    ("Arugula", "Vegetables", "cups", {"calories": 5, "protein": 1, "carbs": 1, "fat": 0}),
-    ("Lettuce", "Vegetables", "cups", {"calories": 5, "protein": 1, "carbs": 1, "fat": 0}),
-    ("Carrots", "Vegetables", "pieces", {"calories": 25, "protein": 1, "carbs": 6, "fat": 0}),
-    ("Celery", "Vegetables", "cups", {"calories": 16, "protein": 1, "carbs": 3, "fat": 0}),
-    ("Cucumber", "Vegetables", "cups", {"calories": 16, "protein": 1, "carbs": 4, "fat": 0}),
-    ("Zucchini", "Vegetables", "cups", {"calories": 20, "protein": 1, "carbs": 4, "fat": 0}),
-    ("Yellow Squash", "Vegetables", "cups", {"calories": 20, "protein": 1, "carbs": 4, "fat": 0}),
-    ("Eggplant", "Vegetables", "cups", {"calories": 20, "protein": 1, "carbs": 5, "fat": 0}),
-    ("Tomatoes", "Vegetables", "pieces", {"calories": 18, "protein": 1, "carbs": 4, "fat": 0}),
-    ("Cherry Tomatoes", "Vegetables", "cups", {"calories": 27, "protein": 1, "carbs": 6, "fat": 0}),
-    ("Mushrooms", "Vegetables", "cups", {"calories": 15, "protein": 2, "carbs": 2, "fat": 0}),
-    ("Asparagus", "Vegetables", "cups", {"calories": 27, "protein": 3, "carbs": 5, "fat": 0}),
-    ("Green Beans", "Vegetables", "cups", {"calories": 35, "protein": 2, "carbs": 8, "fat": 0}),
-    ("Peas", "Vegetables", "cups", {"calories": 134, "protein": 9, "carbs": 25, "fat": 1}),
-    ("Corn", "Vegetables", "cups", {"calories": 143, "protein": 5, "carbs": 31, "fat": 2}),
-    ("Sweet Potato", "Vegetables", "pieces", {"calories": 112, "protein": 2, "carbs": 26, "fat": 0}),
-    ("Potato", "Vegetables", "pieces", {"calories": 161, "protein": 4, "carbs": 37, "fat": 0}),
-    ("Beets", "Vegetables", "cups", {"calories": 58, "protein": 2, "carbs": 13, "fat": 0}),
-    ("Radishes", "Vegetables", "cups", {"calories": 19, "protein": 1, "carbs": 4, "fat": 0}),
-    ("Turnips", "Vegetables", "cups", {"calories": 36, "protein": 1, "carbs": 8, "fat": 0}),
+    ("Onion", "Vegetables", "pieces", Macros(40, 1, 9, 0)),
+    ("Red Onion", "Vegetables", "pieces", Macros(40, 1, 9, 0)),
+    ("Green Onions", "Vegetables", "cups", Macros(32, 2, 7, 0)),
+    ("Garlic", "Vegetables", "cloves", Macros(4, 0.2, 1, 0)),
+    ("Ginger", "Vegetables", "tablespoons", Macros(4, 0.1, 1, 0)),
+    ("Bell Pepper", "Vegetables", "pieces", Macros(25, 1, 6, 0)),
+    ("Red Bell Pepper", "Vegetables", "pieces", Macros(30, 1, 7, 0)),
+    ("Jalapeño", "Vegetables", "pieces", Macros(4, 0, 1, 0)),
+    ("Broccoli", "Vegetables", "cups", Macros(25, 3, 5, 0)),
+    ("Cauliflower", "Vegetables", "cups", Macros(25, 2, 5, 0)),
+    ("Brussels Sprouts", "Vegetables", "cups", Macros(38, 3, 8, 0)),
+    ("Cabbage", "Vegetables", "cups", Macros(22, 1, 5, 0)),
+    ("Spinach", "Vegetables", "cups", Macros(7, 1, 1, 0)),
+    ("Kale", "Vegetables", "cups", Macros(33, 2, 7, 0)),
+    ("Arugula", "Vegetables", "cups", Macros(5, 1, 1, 0)),
+    ("Lettuce", "Vegetables", "cups", Macros(5, 1, 1, 0)),
+    ("Carrots", "Vegetables", "pieces", Macros(25, 1, 6, 0)),
+    ("Celery", "Vegetables", "cups", Macros(16, 1, 3, 0)),
+    ("Cucumber", "Vegetables", "cups", Macros(16, 1, 4, 0)),
+    ("Zucchini", "Vegetables", "cups", Macros(20, 1, 4, 0)),
+    ("Yellow Squash", "Vegetables", "cups", Macros(20, 1, 4, 0)),
+    ("Eggplant", "Vegetables", "cups", Macros(20, 1, 5, 0)),
+    ("Tomatoes", "Vegetables", "pieces", Macros(18, 1, 4, 0)),
+    ("Cherry Tomatoes", "Vegetables", "cups", Macros(27, 1, 6, 0)),
+    ("Mushrooms", "Vegetables", "cups", Macros(15, 2, 2, 0)),
+    ("Asparagus", "Vegetables", "cups", Macros(27, 3, 5, 0)),
+    ("Green Beans", "Vegetables", "cups", Macros(35, 2, 8, 0)),
+    ("Peas", "Vegetables", "cups", Macros(134, 9, 25, 1)),
+    ("Corn", "Vegetables", "cups", Macros(143, 5, 31, 2)),
+    ("Sweet Potato", "Vegetables", "pieces", Macros(112, 2, 26, 0)),
+    ("Potato", "Vegetables", "pieces", Macros(161, 4, 37, 0)),
+    ("Beets", "Vegetables", "cups", Macros(58, 2, 13, 0)),
+    ("Radishes", "Vegetables", "cups", Macros(19, 1, 4, 0)),
+    ("Turnips", "Vegetables", "cups", Macros(36, 1, 8, 0)),
     
     # Fruits
-    ("Apples", "Fruits", "pieces", {"calories": 95, "protein": 0, "carbs": 25, "fat": 0}),
-    ("Bananas", "Fruits", "pieces", {"calories": 105, "protein": 1, "carbs": 27, "fat": 0}),
-    ("Oranges", "Fruits", "pieces", {"calories": 62, "protein": 1, "carbs": 15, "fat": 0}),
-    ("Lemons", "Fruits", "pieces", {"calories": 15, "protein": 0, "carbs": 5, "fat": 0}),
-    ("Limes", "Fruits", "pieces", {"calories": 20, "protein": 0, "carbs": 7, "fat": 0}),
-    ("Grapes", "Fruits", "cups", {"calories": 104, "protein": 1, "carbs": 27, "fat": 0}),
-    ("Strawberries", "Fruits", "cups", {"calories": 49, "protein": 1, "carbs": 12, "fat": 0}),
-    ("Blueberries", "Fruits", "cups", {"calories": 84, "protein": 1, "carbs": 21, "fat": 0}),
-    ("Raspberries", "Fruits", "cups", {"calories": 64, "protein": 1, "carbs": 15, "fat": 1}),
-    ("Blackberries", "Fruits", "cups", {"calories": 62, "protein": 2, "carbs": 14, "fat": 1}),
-    ("Pineapple", "Fruits", "cups", {"calories": 82, "protein": 1, "carbs": 22, "fat": 0}),
-    ("Mango", "Fruits", "cups", {"calories": 107, "protein": 1, "carbs": 28, "fat": 0}),
-    ("Peaches", "Fruits", "pieces", {"calories": 59, "protein": 1, "carbs": 14, "fat": 0}),
-    ("Pears", "Fruits", "pieces", {"calories": 101, "protein": 1, "carbs": 27, "fat": 0}),
-    ("Plums", "Fruits", "pieces", {"calories": 30, "protein": 0, "carbs": 8, "fat": 0}),
-    ("Cherries", "Fruits", "cups", {"calories": 97, "protein": 2, "carbs": 25, "fat": 0}),
-    ("Watermelon", "Fruits", "cups", {"calories": 46, "protein": 1, "carbs": 12, "fat": 0}),
-    ("Cantaloupe", "Fruits", "cups", {"calories": 54, "protein": 1, "carbs": 13, "fat": 0}),
-    ("Avocado", "Fruits", "pieces", {"calories": 320, "protein": 4, "carbs": 17, "fat": 29}),
-    ("Kiwi", "Fruits", "pieces", {"calories": 42, "protein": 1, "carbs": 10, "fat": 0}),
+    ("Apples", "Fruits", "pieces", Macros(95, 0, 25, 0)),
+    ("Bananas", "Fruits", "pieces", Macros(105, 1, 27, 0)),
+    ("Oranges", "Fruits", "pieces", Macros(62, 1, 15, 0)),
+    ("Lemons", "Fruits", "pieces", Macros(15, 0, 5, 0)),
+    ("Limes", "Fruits", "pieces", Macros(20, 0, 7, 0)),
+    ("Grapes", "Fruits", "cups", Macros(104, 1, 27, 0)),
+    ("Strawberries", "Fruits", "cups", Macros(49, 1, 12, 0)),
+    ("Blueberries", "Fruits", "cups", Macros(84, 1, 21, 0)),
+    ("Raspberries", "Fruits", "cups", Macros(64, 1, 15, 1)),
+    ("Blackberries", "Fruits", "cups", Macros(62, 2, 14, 1)),
+    ("Pineapple", "Fruits", "cups", Macros(82, 1, 22, 0)),
+    ("Mango", "Fruits", "cups", Macros(107, 1, 28, 0)),
+    ("Peaches", "Fruits", "pieces", Macros(59, 1, 14, 0)),
+    ("Pears", "Fruits", "pieces", Macros(101, 1, 27, 0)),
+    ("Plums", "Fruits", "pieces", Macros(30, 0, 8, 0)),
+    ("Cherries", "Fruits", "cups", Macros(97, 2, 25, 0)),
+    ("Watermelon", "Fruits", "cups", Macros(46, 1, 12, 0)),
+    ("Cantaloupe", "Fruits", "cups", Macros(54, 1, 13, 0)),
+    ("Avocado", "Fruits", "pieces", Macros(320, 4, 17, 29)),
+    ("Kiwi", "Fruits", "pieces", Macros(42, 1, 10, 0)),
     
     # Grains & Starches
-    ("White Rice", "Grains & Starches", "cups", {"calories": 130, "protein": 3, "carbs": 28, "fat": 0}),
-    ("Brown Rice", "Grains & Starches", "cups", {"calories": 112, "protein": 3, "carbs": 23, "fat": 1}),
-    ("Wild Rice", "Grains & Starches", "cups", {"calories": 166, "protein": 7, "carbs": 35, "fat": 1}),
-    ("Quinoa", "Grains & Starches", "cups", {"calories": 222, "protein": 8, "carbs": 39, "fat": 4}),
-    ("Pasta", "Grains & Starches", "cups", {"calories": 220, "protein": 8, "carbs": 44, "fat": 1}),
-    ("Whole Wheat Pasta", "Grains & Starches", "cups", {"calories": 174, "protein": 7, "carbs": 37, "fat": 1}),
-    ("White Bread", "Grains & Starches", "slices", {"calories": 80, "protein": 3, "carbs": 15, "fat": 1}),
-    ("Whole Wheat Bread", "Grains & Starches", "slices", {"calories": 81, "protein": 4, "carbs": 14, "fat": 1}),
-    ("Sourdough Bread", "Grains & Starches", "slices", {"calories": 93, "protein": 4, "carbs": 18, "fat": 1}),
-    ("Bagels", "Grains & Starches", "pieces", {"calories": 245, "protein": 10, "carbs": 48, "fat": 2}),
-    ("English Muffins", "Grains & Starches", "pieces", {"calories": 134, "protein": 4, "carbs": 26, "fat": 1}),
-    ("Oats", "Grains & Starches", "cups", {"calories": 150, "protein": 5, "carbs": 27, "fat": 3}),
-    ("Steel Cut Oats", "Grains & Starches", "cups", {"calories": 150, "protein": 5, "carbs": 27, "fat": 3}),
-    ("Granola", "Grains & Starches", "cups", {"calories": 597, "protein": 18, "carbs": 65, "fat": 29}),
-    ("Cereal", "Grains & Starches", "cups", {"calories": 110, "protein": 3, "carbs": 22, "fat": 2}),
-    ("Crackers", "Grains & Starches", "pieces", {"calories": 13, "protein": 0, "carbs": 2, "fat": 1}),
-    ("Tortillas", "Grains & Starches", "pieces", {"calories": 104, "protein": 3, "carbs": 18, "fat": 2}),
-    ("Couscous", "Grains & Starches", "cups", {"calories": 176, "protein": 6, "carbs": 36, "fat": 0}),
-    ("Barley", "Grains & Starches", "cups", {"calories": 193, "protein": 4, "carbs": 44, "fat": 1}),
+    ("White Rice", "Grains & Starches", "cups", Macros(130, 3, 28, 0)),
+    ("Brown Rice", "Grains & Starches", "cups", Macros(112, 3, 23, 1)),
+    ("Wild Rice", "Grains & Starches", "cups", Macros(166, 7, 35, 1)),
+    ("Quinoa", "Grains & Starches", "cups", Macros(222, 8, 39, 4)),
+    ("Pasta", "Grains & Starches", "cups", Macros(220, 8, 44, 1)),
+    ("Whole Wheat Pasta", "Grains & Starches", "cups", Macros(174, 7, 37, 1)),
+    ("White Bread", "Grains & Starches", "slices", Macros(80, 3, 15, 1)),
+    ("Whole Wheat Bread", "Grains & Starches", "slices", Macros(81, 4, 14, 1)),
+    ("Sourdough Bread", "Grains & Starches", "slices", Macros(93, 4, 18, 1)),
+    ("Bagels", "Grains & Starches", "pieces", Macros(245, 10, 48, 2)),
+    ("English Muffins", "Grains & Starches", "pieces", Macros(134, 4, 26, 1)),
+    ("Oats", "Grains & Starches", "cups", Macros(150, 5, 27, 3)),
+    ("Steel Cut Oats", "Grains & Starches", "cups", Macros(150, 5, 27, 3)),
+    ("Granola", "Grains & Starches", "cups", Macros(597, 18, 65, 29)),
+    ("Cereal", "Grains & Starches", "cups", Macros(110, 3, 22, 2)),
+    ("Crackers", "Grains & Starches", "pieces", Macros(13, 0, 2, 1)),
+    ("Tortillas", "Grains & Starches", "pieces", Macros(104, 3, 18, 2)),
+    ("Couscous", "Grains & Starches", "cups", Macros(176, 6, 36, 0)),
+    ("Barley", "Grains & Starches", "cups", Macros(193, 4, 44, 1)),
     
     # Dairy
-    ("Whole Milk", "Dairy", "cups", {"calories": 150, "protein": 8, "carbs": 12, "fat": 8}),
-    ("2% Milk", "Dairy", "cups", {"calories": 122, "protein": 8, "carbs": 12, "fat": 5}),
-    ("Skim Milk", "Dairy", "cups", {"calories": 83, "protein": 8, "carbs": 12, "fat": 0}),
-    ("Heavy Cream", "Dairy", "tablespoons", {"calories": 51, "protein": 0, "carbs": 0, "fat": 5}),
-    ("Sour Cream", "Dairy", "tablespoons", {"calories": 23, "protein": 0, "carbs": 1, "fat": 2}),
-    ("Cream Cheese", "Dairy", "tablespoons", {"calories": 51, "protein": 1, "carbs": 1, "fat": 5}),
-    ("Cheddar Cheese", "Dairy", "grams", {"calories": 113, "protein": 7, "carbs": 1, "fat": 9}),
-    ("Mozzarella Cheese", "Dairy", "grams", {"calories": 85, "protein": 6, "carbs": 1, "fat": 6}),
-    ("Parmesan Cheese", "Dairy", "grams", {"calories": 110, "protein": 10, "carbs": 1, "fat": 7}),
-    ("Swiss Cheese", "Dairy", "grams", {"calories": 106, "protein": 8, "carbs": 1, "fat": 8}),
-    ("Feta Cheese", "Dairy", "grams", {"calories": 75, "protein": 4, "carbs": 1, "fat": 6}),
-    ("Regular Yogurt", "Dairy", "cups", {"calories": 150, "protein": 8, "carbs": 17, "fat": 8}),
-    ("Ricotta Cheese", "Dairy", "cups", {"calories": 339, "protein": 28, "carbs": 13, "fat": 20}),
-    ("Butter", "Dairy", "tablespoons", {"calories": 102, "protein": 0, "carbs": 0, "fat": 12}),
-    ("Margarine", "Dairy", "tablespoons", {"calories": 102, "protein": 0, "carbs": 0, "fat": 11}),
+    ("Whole Milk", "Dairy", "cups", Macros(150, 8, 12, 8)),
+    ("2% Milk", "Dairy", "cups", Macros(122, 8, 12, 5)),
+    ("Skim Milk", "Dairy", "cups", Macros(83, 8, 12, 0)),
+    ("Heavy Cream", "Dairy", "tablespoons", Macros(51, 0, 0, 5)),
+    ("Sour Cream", "Dairy", "tablespoons", Macros(23, 0, 1, 2)),
+    ("Cream Cheese", "Dairy", "tablespoons", Macros(51, 1, 1, 5)),
+    ("Cheddar Cheese", "Dairy", "grams", Macros(113, 7, 1, 9)),
+    ("Mozzarella Cheese", "Dairy", "grams", Macros(85, 6, 1, 6)),
+    ("Parmesan Cheese", "Dairy", "grams", Macros(110, 10, 1, 7)),
+    ("Swiss Cheese", "Dairy", "grams", Macros(106, 8, 1, 8)),
+    ("Feta Cheese", "Dairy", "grams", Macros(75, 4, 1, 6)),
+    ("Regular Yogurt", "Dairy", "cups", Macros(150, 8, 17, 8)),
+    ("Ricotta Cheese", "Dairy", "cups", Macros(339, 28, 13, 20)),
+    ("Butter", "Dairy", "tablespoons", Macros(102, 0, 0, 12)),
+    ("Margarine", "Dairy", "tablespoons", Macros(102, 0, 0, 11)),
     
     # Beverages
-    ("Almond Milk", "Beverages", "cups", {"calories": 39, "protein": 1, "carbs": 4, "fat": 3}),
-    ("Soy Milk", "Beverages", "cups", {"calories": 105, "protein": 6, "carbs": 12, "fat": 4}),
-    ("Oat Milk", "Beverages", "cups", {"calories": 120, "protein": 3, "carbs": 16, "fat": 5}),
-    ("Coconut Milk", "Beverages", "cups", {"calories": 76, "protein": 1, "carbs": 7, "fat": 5}),
-    ("Coffee", "Beverages", "cups", {"calories": 2, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Tea", "Beverages", "cups", {"calories": 2, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Water", "Beverages", "cups", {"calories": 0, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Orange Juice", "Beverages", "cups", {"calories": 112, "protein": 2, "carbs": 26, "fat": 0}),
+    ("Almond Milk", "Beverages", "cups", Macros(39, 1, 4, 3)),
+    ("Soy Milk", "Beverages", "cups", Macros(105, 6, 12, 4)),
+    ("Oat Milk", "Beverages", "cups", Macros(120, 3, 16, 5)),
+    ("Coconut Milk", "Beverages", "cups", Macros(76, 1, 7, 5)),
+    ("Coffee", "Beverages", "cups", Macros(2, 0, 0, 0)),
+    ("Tea", "Beverages", "cups", Macros(2, 0, 1, 0)),
+    ("Water", "Beverages", "cups", Macros(0, 0, 0, 0)),
+    ("Orange Juice", "Beverages", "cups", Macros(112, 2, 26, 0)),
     
     # Herbs & Spices
-    ("Salt", "Herbs & Spices", "teaspoons", {"calories": 0, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Black Pepper", "Herbs & Spices", "teaspoons", {"calories": 6, "protein": 0, "carbs": 1, "fat": 0}),
-    ("White Pepper", "Herbs & Spices", "teaspoons", {"calories": 7, "protein": 0, "carbs": 2, "fat": 0}),
-    ("Paprika", "Herbs & Spices", "teaspoons", {"calories": 6, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Cumin", "Herbs & Spices", "teaspoons", {"calories": 8, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Coriander", "Herbs & Spices", "teaspoons", {"calories": 5, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Turmeric", "Herbs & Spices", "teaspoons", {"calories": 8, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Cinnamon", "Herbs & Spices", "teaspoons", {"calories": 6, "protein": 0, "carbs": 2, "fat": 0}),
-    ("Nutmeg", "Herbs & Spices", "teaspoons", {"calories": 12, "protein": 0, "carbs": 1, "fat": 1}),
-    ("Cloves", "Herbs & Spices", "teaspoons", {"calories": 7, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Allspice", "Herbs & Spices", "teaspoons", {"calories": 5, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Bay Leaves", "Herbs & Spices", "pieces", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Basil", "Herbs & Spices", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Oregano", "Herbs & Spices", "teaspoons", {"calories": 3, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Thyme", "Herbs & Spices", "teaspoons", {"calories": 3, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Rosemary", "Herbs & Spices", "teaspoons", {"calories": 4, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Sage", "Herbs & Spices", "teaspoons", {"calories": 2, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Parsley", "Herbs & Spices", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Cilantro", "Herbs & Spices", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Dill", "Herbs & Spices", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Chives", "Herbs & Spices", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Mint", "Herbs & Spices", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Garlic Powder", "Herbs & Spices", "teaspoons", {"calories": 10, "protein": 1, "carbs": 2, "fat": 0}),
-    ("Onion Powder", "Herbs & Spices", "teaspoons", {"calories": 8, "protein": 0, "carbs": 2, "fat": 0}),
-    ("Chili Powder", "Herbs & Spices", "teaspoons", {"calories": 8, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Cayenne Pepper", "Herbs & Spices", "teaspoons", {"calories": 6, "protein": 0, "carbs": 1, "fat": 0}),
+    ("Salt", "Herbs & Spices", "teaspoons", Macros(0, 0, 0, 0)),
+    ("Black Pepper", "Herbs & Spices", "teaspoons", Macros(6, 0, 1, 0)),
+    ("White Pepper", "Herbs & Spices", "teaspoons", Macros(7, 0, 2, 0)),
+    ("Paprika", "Herbs & Spices", "teaspoons", Macros(6, 0, 1, 0)),
+    ("Cumin", "Herbs & Spices", "teaspoons", Macros(8, 0, 1, 0)),
+    ("Coriander", "Herbs & Spices", "teaspoons", Macros(5, 0, 1, 0)),
+    ("Turmeric", "Herbs & Spices", "teaspoons", Macros(8, 0, 1, 0)),
+    ("Cinnamon", "Herbs & Spices", "teaspoons", Macros(6, 0, 2, 0)),
+    ("Nutmeg", "Herbs & Spices", "teaspoons", Macros(12, 0, 1, 1)),
+    ("Cloves", "Herbs & Spices", "teaspoons", Macros(7, 0, 1, 0)),
+    ("Allspice", "Herbs & Spices", "teaspoons", Macros(5, 0, 1, 0)),
+    ("Bay Leaves", "Herbs & Spices", "pieces", Macros(1, 0, 0, 0)),
+    ("Basil", "Herbs & Spices", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Oregano", "Herbs & Spices", "teaspoons", Macros(3, 0, 1, 0)),
+    ("Thyme", "Herbs & Spices", "teaspoons", Macros(3, 0, 1, 0)),
+    ("Rosemary", "Herbs & Spices", "teaspoons", Macros(4, 0, 1, 0)),
+    ("Sage", "Herbs & Spices", "teaspoons", Macros(2, 0, 0, 0)),
+    ("Parsley", "Herbs & Spices", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Cilantro", "Herbs & Spices", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Dill", "Herbs & Spices", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Chives", "Herbs & Spices", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Mint", "Herbs & Spices", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Garlic Powder", "Herbs & Spices", "teaspoons", Macros(10, 1, 2, 0)),
+    ("Onion Powder", "Herbs & Spices", "teaspoons", Macros(8, 0, 2, 0)),
+    ("Chili Powder", "Herbs & Spices", "teaspoons", Macros(8, 0, 1, 0)),
+    ("Cayenne Pepper", "Herbs & Spices", "teaspoons", Macros(6, 0, 1, 0)),
     
     # Oils & Condiments
-    ("Olive Oil", "Oils & Condiments", "tablespoons", {"calories": 119, "protein": 0, "carbs": 0, "fat": 14}),
-    ("Vegetable Oil", "Oils & Condiments", "tablespoons", {"calories": 120, "protein": 0, "carbs": 0, "fat": 14}),
-    ("Canola Oil", "Oils & Condiments", "tablespoons", {"calories": 124, "protein": 0, "carbs": 0, "fat": 14}),
-    ("Coconut Oil", "Oils & Condiments", "tablespoons", {"calories": 117, "protein": 0, "carbs": 0, "fat": 14}),
-    ("Avocado Oil", "Oils & Condiments", "tablespoons", {"calories": 124, "protein": 0, "carbs": 0, "fat": 14}),
-    ("Sesame Oil", "Oils & Condiments", "tablespoons", {"calories": 120, "protein": 0, "carbs": 0, "fat": 14}),
-    ("Soy Sauce", "Oils & Condiments", "tablespoons", {"calories": 10, "protein": 2, "carbs": 1, "fat": 0}),
-    ("Worcestershire Sauce", "Oils & Condiments", "tablespoons", {"calories": 11, "protein": 0, "carbs": 3, "fat": 0}),
-    ("Hot Sauce", "Oils & Condiments", "tablespoons", {"calories": 1, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Ketchup", "Oils & Condiments", "tablespoons", {"calories": 19, "protein": 0, "carbs": 5, "fat": 0}),
-    ("Mustard", "Oils & Condiments", "tablespoons", {"calories": 9, "protein": 1, "carbs": 1, "fat": 1}),
-    ("Mayonnaise", "Oils & Condiments", "tablespoons", {"calories": 94, "protein": 0, "carbs": 0, "fat": 10}),
-    ("Ranch Dressing", "Oils & Condiments", "tablespoons", {"calories": 73, "protein": 0, "carbs": 1, "fat": 8}),
-    ("Balsamic Vinegar", "Oils & Condiments", "tablespoons", {"calories": 10, "protein": 0, "carbs": 2, "fat": 0}),
-    ("Apple Cider Vinegar", "Oils & Condiments", "tablespoons", {"calories": 3, "protein": 0, "carbs": 0, "fat": 0}),
-    ("White Vinegar", "Oils & Condiments", "tablespoons", {"calories": 3, "protein": 0, "carbs": 0, "fat": 0}),
-    ("Honey", "Oils & Condiments", "tablespoons", {"calories": 64, "protein": 0, "carbs": 17, "fat": 0}),
-    ("Maple Syrup", "Oils & Condiments", "tablespoons", {"calories": 52, "protein": 0, "carbs": 13, "fat": 0}),
-    ("Lemon Juice", "Oils & Condiments", "tablespoons", {"calories": 4, "protein": 0, "carbs": 1, "fat": 0}),
-    ("Lime Juice", "Oils & Condiments", "tablespoons", {"calories": 4, "protein": 0, "carbs": 1, "fat": 0}),
+    ("Olive Oil", "Oils & Condiments", "tablespoons", Macros(119, 0, 0, 14)),
+    ("Vegetable Oil", "Oils & Condiments", "tablespoons", Macros(120, 0, 0, 14)),
+    ("Canola Oil", "Oils & Condiments", "tablespoons", Macros(124, 0, 0, 14)),
+    ("Coconut Oil", "Oils & Condiments", "tablespoons", Macros(117, 0, 0, 14)),
+    ("Avocado Oil", "Oils & Condiments", "tablespoons", Macros(124, 0, 0, 14)),
+    ("Sesame Oil", "Oils & Condiments", "tablespoons", Macros(120, 0, 0, 14)),
+    ("Soy Sauce", "Oils & Condiments", "tablespoons", Macros(10, 2, 1, 0)),
+    ("Worcestershire Sauce", "Oils & Condiments", "tablespoons", Macros(11, 0, 3, 0)),
+    ("Hot Sauce", "Oils & Condiments", "tablespoons", Macros(1, 0, 0, 0)),
+    ("Ketchup", "Oils & Condiments", "tablespoons", Macros(19, 0, 5, 0)),
+    ("Mustard", "Oils & Condiments", "tablespoons", Macros(9, 1, 1, 1)),
+    ("Mayonnaise", "Oils & Condiments", "tablespoons", Macros(94, 0, 0, 10)),
+    ("Ranch Dressing", "Oils & Condiments", "tablespoons", Macros(73, 0, 1, 8)),
+    ("Balsamic Vinegar", "Oils & Condiments", "tablespoons", Macros(10, 0, 2, 0)),
+    ("Apple Cider Vinegar", "Oils & Condiments", "tablespoons", Macros(3, 0, 0, 0)),
+    ("White Vinegar", "Oils & Condiments", "tablespoons", Macros(3, 0, 0, 0)),
+    ("Honey", "Oils & Condiments", "tablespoons", Macros(64, 0, 17, 0)),
+    ("Maple Syrup", "Oils & Condiments", "tablespoons", Macros(52, 0, 13, 0)),
+    ("Lemon Juice", "Oils & Condiments", "tablespoons", Macros(4, 0, 1, 0)),
+    ("Lime Juice", "Oils & Condiments", "tablespoons", Macros(4, 0, 1, 0)),
     
     # Nuts & Seeds
-    ("Almonds", "Nuts & Seeds", "grams", {"calories": 579, "protein": 21, "carbs": 22, "fat": 50}),
-    ("Walnuts", "Nuts & Seeds", "grams", {"calories": 654, "protein": 15, "carbs": 14, "fat": 65}),
-    ("Cashews", "Nuts & Seeds", "grams", {"calories": 553, "protein": 18, "carbs": 30, "fat": 44}),
-    ("Pecans", "Nuts & Seeds", "grams", {"calories": 691, "protein": 9, "carbs": 14, "fat": 72}),
-    ("Brazil Nuts", "Nuts & Seeds", "grams", {"calories": 656, "protein": 14, "carbs": 12, "fat": 66}),
-    ("Hazelnuts", "Nuts & Seeds", "grams", {"calories": 628, "protein": 15, "carbs": 17, "fat": 61}),
-    ("Pistachios", "Nuts & Seeds", "grams", {"calories": 560, "protein": 20, "carbs": 28, "fat": 45}),
-    ("Macadamia Nuts", "Nuts & Seeds", "grams", {"calories": 718, "protein": 8, "carbs": 14, "fat": 76}),
-    ("Pine Nuts", "Nuts & Seeds", "grams", {"calories": 673, "protein": 14, "carbs": 13, "fat": 68}),
-    ("Peanuts", "Nuts & Seeds", "grams", {"calories": 567, "protein": 26, "carbs": 16, "fat": 49}),
-    ("Peanut Butter", "Nuts & Seeds", "tablespoons", {"calories": 94, "protein": 4, "carbs": 4, "fat": 8}),
-    ("Almond Butter", "Nuts & Seeds", "tablespoons", {"calories": 98, "protein": 4, "carbs": 4, "fat": 9}),
-    ("Sunflower Seeds", "Nuts & Seeds", "grams", {"calories": 584, "protein": 21, "carbs": 20, "fat": 51}),
-    ("Pumpkin Seeds", "Nuts & Seeds", "grams", {"calories": 559, "protein": 30, "carbs": 11, "fat": 49}),
-    ("Chia Seeds", "Nuts & Seeds", "tablespoons", {"calories": 58, "protein": 2, "carbs": 5, "fat": 4}),
-    ("Flax Seeds", "Nuts & Seeds", "tablespoons", {"calories": 55, "protein": 2, "carbs": 3, "fat": 4}),
-    ("Hemp Seeds", "Nuts & Seeds", "tablespoons", {"calories": 51, "protein": 3, "carbs": 1, "fat": 4}),
-    ("Sesame Seeds", "Nuts & Seeds", "tablespoons", {"calories": 52, "protein": 2, "carbs": 2, "fat": 4}),
-]
\ No newline at end of file
+    ("Almonds", "Nuts & Seeds", "grams", Macros(579, 21, 22, 50)),
+    ("Walnuts", "Nuts & Seeds", "grams", Macros(654, 15, 14, 65)),
+    ("Cashews", "Nuts & Seeds", "grams", Macros(553, 18, 30, 44)),
+    ("Pecans", "Nuts & Seeds", "grams", Macros(691, 9, 14, 72)),
+    ("Brazil Nuts", "Nuts & Seeds", "grams", Macros(656, 14, 12, 66)),
+    ("Hazelnuts", "Nuts & Seeds", "grams", Macros(628, 15, 17, 61)),
+    ("Pistachios", "Nuts & Seeds", "grams", Macros(560, 20, 28, 45)),
+    ("Macadamia Nuts", "Nuts & Seeds", "grams", Macros(718, 8, 14, 76)),
+    ("Pine Nuts", "Nuts & Seeds", "grams", Macros(673, 14, 13, 68)),
+    ("Peanuts", "Nuts & Seeds", "grams", Macros(567, 26, 16, 49)),
+    ("Peanut Butter", "Nuts & Seeds", "tablespoons", Macros(94, 4, 4, 8)),
+    ("Almond Butter", "Nuts & Seeds", "tablespoons", Macros(98, 4, 4, 9)),
+    ("Sunflower Seeds", "Nuts & Seeds", "grams", Macros(584, 21, 20, 51)),
+    ("Pumpkin Seeds", "Nuts & Seeds", "grams", Macros(559, 30, 11, 49)),
+    ("Chia Seeds", "Nuts & Seeds", "tablespoons", Macros(58, 2, 5, 4)),
+    ("Flax Seeds", "Nuts & Seeds", "tablespoons", Macros(55, 2, 3, 4)),
+    ("Hemp Seeds", "Nuts & Seeds", "tablespoons", Macros(51, 3, 1, 4)),
+    ("Sesame Seeds", "Nuts & Seeds", "tablespoons", Macros(52, 2, 2, 4)),
+]
@@ -1,29 +1,233 @@
-from sqlalchemy import create_engine
+import os
+import re
+import time
+import uuid
+from functools import lru_cache
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 from app.core.config import get_settings
 
 # Get settings instance
 settings = get_settings()
 
-connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args=connect_args,
-    echo=getattr(settings, 'DEBUG', False)  # Safe access to DEBUG
-)
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection: WAL journal, relaxed fsync, in-memory temp, 64MB cache"""
+    cursor = dbapi_connection.cursor()
+    # Enforce foreign keys so ON DELETE CASCADE removes children as it does on Postgres
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+def _engine_options(database_url: str) -> dict:
+    """Build create_engine() keyword arguments for the configured backend"""
+    options = {
+        "echo": getattr(settings, 'DEBUG', False)  # Safe access to DEBUG
+    }
+    
+    if database_url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+        if make_url(database_url).database in (None, "", ":memory:"):
+            # In-memory databases only exist on the connection that created them
+            options["poolclass"] = StaticPool
+        else:
+            # Keep file connections open across requests; WAL lets readers run alongside a writer
+            options.update({
+                "poolclass": QueuePool,
+                "pool_size": 5,
+                "max_overflow": 10,
+                "pool_pre_ping": True
+            })
+        return options
+    
+    options.update({
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        # Batch multi-row INSERT/UPDATE instead of one statement per row
+        "insertmanyvalues_page_size": 1000
+    })
+    if make_url(database_url).get_driver_name() == "psycopg2":
+        options.update({
+            "executemany_mode": "values_plus_batch",
+            "executemany_batch_page_size": 500
+        })
+    return options
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Get the shared engine (and connection pool), creating it on first use"""
+    engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_session_factory():
+    """Session factory for read/write work"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@lru_cache(maxsize=1)
+def get_read_session_factory():
+    """Session factory for read-only work; objects stay usable after the session ends"""
+    return sessionmaker(autoflush=False, expire_on_commit=False, bind=get_engine())
+
+
+# libpq connection parameters asyncpg.connect() does not accept; translated below or dropped
+_LIBPQ_ONLY_PARAMS = frozenset({
+    "sslmode", "sslrootcert", "sslcert", "sslkey", "sslpassword", "sslcrl", "sslcrldir",
+    "sslsni", "sslcompression", "sslcertmode", "ssl_min_protocol_version",
+    "ssl_max_protocol_version", "requiressl", "options", "application_name",
+    "fallback_application_name", "client_encoding", "connect_timeout", "keepalives",
+    "keepalives_idle", "keepalives_interval", "keepalives_count", "tcp_user_timeout",
+    "gssencmode", "gssdelegation", "channel_binding", "require_auth", "requirepeer",
+    "service", "replication", "load_balance_hosts", "hostaddr",
+})
+# libpq parameters asyncpg takes under the same name, but only as connect() arguments
+_ASYNCPG_CONNECT_PARAMS = ("target_session_attrs", "passfile", "krbsrvname", "gsslib")
+
+
+def _libpq_ssl(query):
+    """asyncpg's `ssl` argument for libpq's sslmode and certificate file parameters"""
+    import ssl
+
+    sslmode = query.get("sslmode", "prefer")
+    if not any(key in query for key in ("sslrootcert", "sslcert", "sslkey")):
+        return sslmode
+    if sslmode == "disable":
+        return False
+    context = ssl.create_default_context(cafile=query.get("sslrootcert"))
+    # Like libpq, a root certificate turns `require` into CA verification
+    context.check_hostname = sslmode == "verify-full"
+    if sslmode in ("allow", "prefer") or ("sslrootcert" not in query and sslmode == "require"):
+        context.verify_mode = ssl.CERT_NONE
+    if "sslcert" in query:
+        context.load_cert_chain(query["sslcert"], query.get("sslkey"), query.get("sslpassword"))
+    return context
+
+
+def _async_database_url(database_url: str):
+    """Map the configured URL onto its asyncio driver (asyncpg / aiosqlite)"""
+    url = make_url(database_url)
+    connect_args = {}
+    if url.get_backend_name() == "postgresql":
+        query = url.query
+        if any(key in query for key in ("sslmode", "sslrootcert", "sslcert", "sslkey")):
+            connect_args["ssl"] = _libpq_ssl(query)
+        # Settings libpq sends at startup become asyncpg server_settings
+        server_settings = {}
+        for name, value in re.findall(r"(?:-c\s*|--)([\w.]+)=(\S+)", query.get("options", "")):
+            server_settings[name.replace("-", "_")] = value
+        application_name = query.get("application_name", query.get("fallback_application_name"))
+        if application_name:
+            server_settings["application_name"] = application_name
+        if "client_encoding" in query:
+            server_settings["client_encoding"] = query["client_encoding"]
+        if server_settings:
+            connect_args["server_settings"] = server_settings
+        if "connect_timeout" in query:
+            connect_args["timeout"] = float(query["connect_timeout"])
+        for key in _ASYNCPG_CONNECT_PARAMS:
+            if key in query:
+                connect_args[key] = query[key]
+        url = url.difference_update_query(_LIBPQ_ONLY_PARAMS.union(_ASYNCPG_CONNECT_PARAMS))
+        url = url.set(drivername="postgresql+asyncpg")
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url, connect_args
+
+
+@lru_cache(maxsize=1)
+def get_async_engine():
+    """Get the shared asyncio engine, creating it on first use"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    
+    url, connect_args = _async_database_url(settings.DATABASE_URL)
+    options = {
+        "echo": getattr(settings, 'DEBUG', False),
+        "connect_args": connect_args
+    }
+    if url.get_backend_name() == "postgresql":
+        if settings.ENVIRONMENT == "test":
+            # TestClient may run requests on fresh event loops; pooled asyncpg connections can't cross loops
+            options["poolclass"] = NullPool
+        else:
+            options.update({
+                # Its own budget on top of the sync pool, not a second copy of it
+                "pool_size": settings.DB_ASYNC_POOL_SIZE,
+                "max_overflow": settings.DB_ASYNC_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+                "pool_pre_ping": True
+            })
+    
+    engine = create_async_engine(url, **options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_async_session_factory():
+    """Async session factory; objects stay usable after the session ends"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def __getattr__(name):
+    # Keep `from app.db.database import engine, SessionLocal` working without creating them at import
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+# Shared server-side "now" for created_at/updated_at defaults (now() on Postgres, CURRENT_TIMESTAMP on SQLite)
+TS_NOW = func.now()
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7) for primary keys: 48-bit Unix-ms timestamp, then random bits"""
+    # New ids land at the right edge of the primary-key index instead of at random pages
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def dialect_insert(db, entity):
+    """insert() for the session's backend, so callers can use on_conflict_do_update()"""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(entity)
+
+
 def get_db():
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """FastAPI dependency yielding an AsyncSession (no worker thread held while awaiting the DB)"""
+    async with get_async_session_factory()() as db:
+        yield db
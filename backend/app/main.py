@@ -1,241 +1,252 @@
 """
 Main FastAPI application instance and configuration
 """
+from __future__ import annotations
+
+import asyncio
 import logging
 import datetime
+import importlib
+import re
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from typing import TYPE_CHECKING, List, Optional
 
 from .core.config import get_settings
-from .core.database_service import init_db, db_service
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging: ISO-8601 UTC timestamps (gmtime skips the per-record localtime lookup)
+_log_handler = logging.StreamHandler()
+_log_formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
+_log_formatter.converter = time.gmtime
+_log_handler.setFormatter(_log_formatter)
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler], force=True)
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# (module under app.api, mount prefix, OpenAPI tags) for every API router
+_ROUTERS = (
+    ("auth", "/api/v1/auth", ["authentication"]),
+    ("family", "/api/v1", ["family"]),
+    ("pantry", "/api/v1", ["pantry"]),
+    ("ingredients", "/api/v1", ["ingredients"]),
+    ("recommendations", "/api/v1", ["recommendations"]),
+    ("recipes", "/api/v1/recipes", ["recipes"]),
+    ("meal_plans", "/api/v1", ["meal-plans"]),
+    ("admin", "/api/v1", ["admin"]),
+    ("books", "/api/v1/books", ["books"]),
+    ("movies", "/api/v1/movies", ["movies"]),
+    # Migration endpoints for database schema updates
+    ("migrate", "/api/v1/migrate", ["migration"]),
+    # Content sharing endpoints
+    ("sharing", "/api/v1/sharing", ["sharing"]),
+)
+
+# Every method the API routers use (PATCH included), plus preflight
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
+# Backoff between database setup attempts (seconds): doubles from the first delay up to the cap
+_INIT_RETRY_DELAY = 1.0
+_INIT_RETRY_MAX_DELAY = 60.0
+
+
+async def _initialize_database():
+    """Create tables, seed data and bring the schema up to date"""
+    # Imported here so loading app.main doesn't pull in the DB service and its models up front
+    from .core.database_service import init_db
+
+    # Replicas can leave migrations to a one-shot `python -m app.migrations.run_all` job
+    if not settings.RUN_MIGRATIONS:
+        await asyncio.to_thread(init_db)
+        logger.info("✅ Database initialization complete")
+        logger.info("⏭️ RUN_MIGRATIONS disabled, skipping startup migrations")
+        return
+
+    from .migrations.run_all import run_all, schema_is_current
+    # The fingerprint read doesn't depend on init_db, so overlap the two round-trips
+    _, schema_current = await asyncio.gather(
+        asyncio.to_thread(init_db),
+        asyncio.to_thread(schema_is_current),
+    )
+    logger.info("✅ Database initialization complete")
+    await asyncio.to_thread(run_all, schema_current)
+
+
+async def _deferred_init(app: FastAPI):
+    """Run database setup off the event loop, retrying until it succeeds, then flag the app ready"""
+    delay = _INIT_RETRY_DELAY
+    while True:
+        try:
+            await _initialize_database()
+            break
+        except Exception as e:
+            # Every setup step is idempotent, so a retry picks up where the failed attempt stopped
+            logger.error(f"❌ Database initialization failed, retrying in {delay:.0f}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _INIT_RETRY_MAX_DELAY)
+    app.state.ready.set()
+    logger.info("✅ Application startup complete")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info("🚀 Starting Food Planning App API (PostgreSQL ready) - Preview deployment with AI, ingredients v2, and recipe ratings...")
-    logger.info(f"Database URL: {get_settings().DATABASE_URL}")
-    init_db()
-    logger.info("✅ Database initialization complete")
+    logger.info(f"Database URL: {settings.DATABASE_URL}")
     
-    # Ensure RecipeV2 table exists with correct schema
-    try:
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.abspath(__file__ + "/../")))
-        from ensure_recipes_v2 import ensure_recipes_v2_table
-        ensure_recipes_v2_table()
-    except Exception as e:
-        logger.warning(f"⚠️ RecipeV2 table check failed: {e}")
-    
-    # Ensure recipe_ratings table exists
-    try:
-        from ensure_recipe_ratings_table import ensure_recipe_ratings_table
-        ensure_recipe_ratings_table()
-    except Exception as e:
-        logger.warning(f"⚠️ Recipe ratings table check failed: {e}")
+    # Serve /health straight away; /health/ready reports 503 until the database is set up
+    app.state.ready = asyncio.Event()
+    app.state.init_task = asyncio.create_task(_deferred_init(app))
     
-    # Run database migrations
-    try:
-        from .migrations.add_dietary_restrictions import add_dietary_restrictions_column
-        add_dietary_restrictions_column()
-    except Exception as e:
-        logger.warning(f"⚠️ Database migration failed: {e}")
+    yield
     
-    # Update ingredient categories to new structure
+    # Shutdown
+    logger.info("🛑 Shutting down Food Planning App API...")
+    app.state.init_task.cancel()
     try:
-        from .migrations.update_ingredient_categories import migrate_ingredient_categories
-        migrate_ingredient_categories()
-    except Exception as e:
-        logger.warning(f"⚠️ Ingredient categories migration failed: {e}")
+        await app.state.init_task
+    except asyncio.CancelledError:
+        pass
+
+
+def _include_routers(app: FastAPI):
+    """Import the API router modules and attach them to ``app``"""
+    router_status = {}
     
-    # Add book recommendation feedback table
-    try:
-        from .migrations.add_book_recommendation_feedback import add_book_recommendation_feedback_table
-        add_book_recommendation_feedback_table()
-    except Exception as e:
-        logger.warning(f"⚠️ Book recommendation feedback table migration failed: {e}")
+    # Import each router individually to catch specific import errors
+    for name, prefix, tags in _ROUTERS:
+        try:
+            module = importlib.import_module(f".api.{name}", __package__)
+            app.include_router(module.router, prefix=prefix, tags=tags)
+            router_status[name] = "✅ Success"
+        except Exception as e:
+            router_status[name] = f"❌ Failed: {e}"
     
-    logger.info("✅ Application startup complete")
+    # One record for the whole registration; the dict also rides along for structured handlers
+    failed = any(status.startswith("❌") for status in router_status.values())
+    logger.log(
+        logging.ERROR if failed else logging.INFO,
+        "🔧 Router registration status: %s",
+        router_status,
+        extra={"router_status": router_status}
+    )
+
+
+class _IncludeRoutersOnFirstCall:
+    """ASGI middleware that attaches the API routers when the app handles its first event"""
     
-    yield
+    def __init__(self, app, target: FastAPI):
+        self.app = app
+        self.target = target
+        self.routers_included = False
     
-    # Shutdown
-    logger.info("🛑 Shutting down Food Planning App API...")
+    async def __call__(self, scope, receive, send):
+        # Under uvicorn the first event is lifespan startup, so routes exist before traffic arrives
+        if not self.routers_included:
+            self.routers_included = True
+            _include_routers(self.target)
+        await self.app(scope, receive, send)
+
+
+def _wildcard_origin_regex(origins: List[str]) -> Optional[str]:
+    """Regex matching the wildcard entries in ``origins`` ("*" stands for one DNS label)"""
+    patterns = [re.escape(origin).replace(r"\*", r"[^./]+") for origin in origins if "*" in origin]
+    return "|".join(patterns) or None
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
+    # FastAPI/Starlette are only imported once an app is actually built
+    from fastapi import FastAPI, Response
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import ORJSONResponse
+    from starlette.routing import Route
+    import orjson
     
     app = FastAPI(
         title=settings.APP_NAME,
         version=settings.VERSION,
         description="AI-powered meal planning and family nutrition management",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
     
-    # CORS middleware - temporarily allow all origins for debugging
+    # CORS middleware - exact origins from settings, wildcard entries (e.g. Vercel previews) as a regex
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Temporarily allow all origins
+        allow_origins=[origin for origin in settings.CORS_ORIGINS if "*" not in origin],
+        allow_origin_regex=_wildcard_origin_regex(settings.CORS_ORIGINS),
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=_CORS_METHODS,
         allow_headers=["*"],
         expose_headers=["*"],
-        max_age=3600,
+        max_age=settings.CORS_MAX_AGE,
     )
     
-    # Import and include routers with detailed error handling
-    router_status = {}
+    # Router modules are imported on the app's first ASGI call rather than here
+    app.add_middleware(_IncludeRoutersOnFirstCall, target=app)
     
-    try:
-        # Import each router individually to catch specific import errors
-        try:
-            from .api import auth
-            app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
-            router_status["auth"] = "✅ Success"
-        except Exception as e:
-            router_status["auth"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Auth router error: {e}")
-        
-        try:
-            from .api import family
-            app.include_router(family.router, prefix="/api/v1", tags=["family"])
-            router_status["family"] = "✅ Success"
-        except Exception as e:
-            router_status["family"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Family router error: {e}")
-        
-        try:
-            from .api import pantry
-            app.include_router(pantry.router, prefix="/api/v1", tags=["pantry"])
-            router_status["pantry"] = "✅ Success"
-        except Exception as e:
-            router_status["pantry"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Pantry router error: {e}")
-        
-        try:
-            from .api import ingredients
-            app.include_router(ingredients.router, prefix="/api/v1", tags=["ingredients"])
-            router_status["ingredients"] = "✅ Success"
-        except Exception as e:
-            router_status["ingredients"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Ingredients router error: {e}")
-        
-        try:
-            from .api import recommendations
-            app.include_router(recommendations.router, prefix="/api/v1", tags=["recommendations"])
-            router_status["recommendations"] = "✅ Success"
-        except Exception as e:
-            router_status["recommendations"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Recommendations router error: {e}")
-        
-        try:
-            from .api import recipes
-            app.include_router(recipes.router, prefix="/api/v1/recipes", tags=["recipes"])
-            router_status["recipes"] = "✅ Success"
-            logger.info(f"📝 Recipes router registered at: /api/v1/recipes")
-        except Exception as e:
-            router_status["recipes"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Recipes router error: {e}")
-        
-# Removed recipes_optimized - using single simple recipes implementation
-        
-        try:
-            from .api import meal_plans
-            app.include_router(meal_plans.router, prefix="/api/v1", tags=["meal-plans"])
-            router_status["meal_plans"] = "✅ Success"
-        except Exception as e:
-            router_status["meal_plans"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Meal plans router error: {e}")
-        
-        try:
-            from .api import admin
-            app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
-            router_status["admin"] = "✅ Success"
-        except Exception as e:
-            router_status["admin"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Admin router error: {e}")
-        
-        try:
-            from .api import books
-            app.include_router(books.router, prefix="/api/v1/books", tags=["books"])
-            router_status["books"] = "✅ Success"
-            logger.info(f"📚 Books router registered at: /api/v1/books")
-        except Exception as e:
-            router_status["books"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Books router error: {e}")
-        
-        try:
-            from .api import movies
-            app.include_router(movies.router, prefix="/api/v1/movies", tags=["movies"])
-            router_status["movies"] = "✅ Success"
-            logger.info(f"🎬 Movies router registered at: /api/v1/movies")
-        except Exception as e:
-            router_status["movies"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Movies router error: {e}")
-        
-        # Migration endpoints for database schema updates
-        try:
-            from .api import migrate
-            app.include_router(migrate.router, prefix="/api/v1/migrate", tags=["migration"])
-            router_status["migrate"] = "✅ Success"
-        except Exception as e:
-            router_status["migrate"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Migration router error: {e}")
-        
-        # Content sharing endpoints
-        try:
-            from .api import sharing
-            app.include_router(sharing.router, prefix="/api/v1/sharing", tags=["sharing"])
-            router_status["sharing"] = "✅ Success"
-        except Exception as e:
-            router_status["sharing"] = f"❌ Failed: {e}"
-            logger.error(f"❌ Sharing router error: {e}")
-        
-        logger.info(f"🔧 Router registration status: {router_status}")
-        
-    except Exception as e:
-        logger.error(f"❌ Critical error in router setup: {e}")
-        raise
+    # Probe payloads never change at runtime, so serialize them once
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "environment": settings.ENVIRONMENT,
+        "deployment_info": settings.deployment_info,
+        "version": settings.VERSION
+    })
+    root_body = orjson.dumps({"message": settings.APP_NAME})
+    not_ready_body = orjson.dumps({"status": "starting"})
     
     # Health check endpoint
     @app.get("/health")
     async def health_check():
         """Health check endpoint"""
-        return {
-            "status": "healthy",
-            "environment": settings.ENVIRONMENT,
-            "deployment_info": settings.deployment_info,
-            "version": settings.VERSION
-        }
+        return Response(health_body, media_type="application/json")
+    
+    @app.get("/health/live")
+    async def health_live():
+        """Liveness probe: the process is up and serving"""
+        return Response(health_body, media_type="application/json")
+    
+    @app.get("/health/ready")
+    async def health_ready():
+        """Readiness probe: 503 until startup database initialization has finished"""
+        ready = getattr(app.state, "ready", None)
+        if ready is not None and not ready.is_set():
+            return Response(
+                not_ready_body,
+                status_code=503,
+                media_type="application/json",
+                headers={"Retry-After": "2"}
+            )
+        return Response(health_body, media_type="application/json")
     
     @app.get("/")
     async def root():
         """Root endpoint"""
-        return {"message": settings.APP_NAME}
+        return Response(root_body, media_type="application/json")
     
     @app.get("/debug/routes")
     async def debug_routes():
         """Debug endpoint to show all registered routes"""
-        routes = []
-        for route in app.routes:
-            if hasattr(route, 'path'):
-                route_info = {
+        # The route table only changes when routers are included, so rebuild on a size change
+        cached = getattr(app.state, "routes_cache", None)
+        if cached is None or cached[0] != len(app.routes):
+            routes = [
+                {
                     "path": route.path,
-                    "methods": getattr(route, 'methods', None),
-                    "name": getattr(route, 'name', None)
+                    "methods": sorted(route.methods) if route.methods else None,
+                    "name": route.name
                 }
-                routes.append(route_info)
+                for route in app.router.routes
+                if isinstance(route, Route)
+            ]
+            cached = app.state.routes_cache = (len(app.routes), routes)
+        routes = cached[1]
         
         return {
             "app": "modular_app (app.main:app)",
@@ -247,5 +258,9 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create the app instance
-app = create_app()
\ No newline at end of file
+def __getattr__(name):
+    # `app.main:app` (uvicorn) and `from app.main import app` build the app on first access
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
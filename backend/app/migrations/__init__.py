@@ -1 +1,61 @@
-# Database migrations
\ No newline at end of file
+# Database migrations
+import logging
+from typing import Dict
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# One catalog round-trip answering "does this migration still need to run?" for each
+# startup migration; a NULL to_regclass() means the table doesn't exist yet.
+# book_feedback looks for the script's indexes and trigger rather than the table,
+# since create_all builds the table (without them) on a fresh database
+_PENDING_SQL = text("""
+    SELECT
+        (
+            SELECT count(*) FROM pg_class
+            WHERE relnamespace = current_schema()::regnamespace
+            AND relkind = 'i'
+            AND relname = ANY(ARRAY['idx_book_recommendation_feedback_user_id',
+                                    'idx_book_recommendation_feedback_session_id',
+                                    'idx_book_recommendation_feedback_type',
+                                    'idx_book_recommendation_feedback_created_at'])
+        ) < 4
+        OR NOT EXISTS (
+            SELECT 1 FROM pg_trigger
+            WHERE tgrelid = to_regclass(quote_ident(current_schema()) || '.book_recommendation_feedback')
+            AND tgname = 'update_book_recommendation_feedback_updated_at'
+        ) AS book_feedback,
+        NOT EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = to_regclass(quote_ident(current_schema()) || '.family_members')
+            AND attname = 'dietary_restrictions' AND NOT attisdropped
+        ) AS dietary_restrictions,
+        (
+            SELECT count(*) FROM pg_attribute
+            WHERE attrelid = to_regclass(quote_ident(current_schema()) || '.recipe_ratings')
+            AND attname = ANY(ARRAY['id', 'recipe_id', 'user_id', 'rating', 'review_text',
+                                    'would_make_again', 'cooking_notes', 'created_at', 'updated_at'])
+            AND NOT attisdropped
+        ) < 9 AS recipe_ratings
+""")
+
+
+def check_pending() -> Dict[str, bool]:
+    """Map of startup migration name -> still needs to run
+
+    Migrations missing from the map (and every migration on non-PostgreSQL databases)
+    should be treated as pending; each one remains idempotent on its own.
+    """
+    from ..db.database import get_engine
+    
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        return {}
+    
+    try:
+        with engine.connect() as conn:
+            return dict(conn.execute(_PENDING_SQL).mappings().one())
+    except Exception as e:
+        logger.warning(f"⚠️ Could not check pending migrations: {e}")
+        return {}
@@ -0,0 +1,41 @@
+"""
+Migration to add the generated content_id column to content_ratings and content_shares
+"""
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+# content_id mirrors whichever of the four typed content columns is set, so
+# (content_type, content_id) lookups need one index instead of one per column
+MIGRATION_SQL = """
+    ALTER TABLE content_ratings ADD COLUMN IF NOT EXISTS content_id UUID
+        GENERATED ALWAYS AS (COALESCE(recipe_id, book_id, tv_show_id, movie_id)) STORED;
+    ALTER TABLE content_shares ADD COLUMN IF NOT EXISTS content_id UUID
+        GENERATED ALWAYS AS (COALESCE(recipe_id, book_id, tv_show_id, movie_id)) STORED;
+"""
+
+
+def add_content_id_columns():
+    """Add content_id to content tables created before the column existed (PostgreSQL 12+)"""
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        # create_all() builds the column with new tables; older SQLite dev databases can be recreated
+        logger.info("⏭️ content_id migration only runs on PostgreSQL")
+        return
+    
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(MIGRATION_SQL)
+        logger.info("✅ content_id columns are in place")
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Database error adding content_id columns: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    add_content_id_columns()
@@ -2,18 +2,16 @@
 Add dietary_restrictions column to family_members table
 """
 import logging
-from sqlalchemy import create_engine, text
-from ..core.config import get_settings
+from sqlalchemy import text
+from ..db.database import get_engine
 
 logger = logging.getLogger(__name__)
 
 def add_dietary_restrictions_column():
     """Add dietary_restrictions column to family_members table if it doesn't exist"""
     try:
-        settings = get_settings()
-        engine = create_engine(settings.DATABASE_URL)
-        
-        with engine.connect() as conn:
+        # Shared application engine; begin() commits the ALTER on success
+        with get_engine().begin() as conn:
             # Check if dietary_restrictions column exists
             check_column_sql = text("""
                 SELECT column_name 
@@ -28,14 +26,13 @@ def add_dietary_restrictions_column():
             if not column_exists:
                 logger.info("Adding dietary_restrictions column to family_members table...")
                 
-                # Add the column with JSON type and default empty array
+                # Add the column with JSONB type and default empty array
                 add_column_sql = text("""
                     ALTER TABLE family_members 
-                    ADD COLUMN dietary_restrictions JSON DEFAULT '[]'::json
+                    ADD COLUMN dietary_restrictions JSONB DEFAULT '[]'::jsonb
                 """)
                 
                 conn.execute(add_column_sql)
-                conn.commit()
                 
                 logger.info("✅ Successfully added dietary_restrictions column")
             else:
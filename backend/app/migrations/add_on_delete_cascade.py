@@ -0,0 +1,71 @@
+"""
+Recreate foreign keys the models declare with ON DELETE CASCADE on databases that predate it
+"""
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import Base, get_engine
+from .. import models  # noqa: F401 - registers every table on Base.metadata
+
+logger = logging.getLogger(__name__)
+
+
+# Single-column foreign keys whose delete action isn't CASCADE yet
+_SELECT_NON_CASCADING_FKS = text("""
+    SELECT rel.relname AS table_name, att.attname AS column_name, con.conname
+    FROM pg_constraint con
+    JOIN pg_class rel ON rel.oid = con.conrelid
+    JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = con.conkey[1]
+    WHERE con.contype = 'f'
+    AND con.confdeltype <> 'c'
+    AND cardinality(con.conkey) = 1
+    AND rel.relnamespace = current_schema()::regnamespace
+""")
+
+
+def add_on_delete_cascade():
+    """Switch every model foreign key declared ondelete="CASCADE" over to ON DELETE CASCADE"""
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        logger.info("⏭️ ON DELETE CASCADE migration only runs on PostgreSQL")
+        return
+
+    cascading = {
+        (fk.parent.table.name, fk.parent.name): fk
+        for table in Base.metadata.tables.values()
+        for fk in table.foreign_keys
+        if fk.ondelete == "CASCADE"
+    }
+
+    try:
+        with engine.connect() as conn:
+            stale = [
+                (row.table_name, row.column_name, row.conname)
+                for row in conn.execute(_SELECT_NON_CASCADING_FKS)
+                if (row.table_name, row.column_name) in cascading
+            ]
+
+        for table, column, constraint in stale:
+            target = cascading[(table, column)].column
+            # NOT VALID swaps the constraint without scanning the table under the ALTER's lock;
+            # VALIDATE then checks existing rows with a lighter lock
+            with engine.begin() as conn:
+                conn.exec_driver_sql(
+                    f'ALTER TABLE {table} DROP CONSTRAINT "{constraint}", '
+                    f'ADD CONSTRAINT "{constraint}" FOREIGN KEY ({column}) '
+                    f'REFERENCES {target.table.name} ({target.name}) ON DELETE CASCADE NOT VALID'
+                )
+            with engine.begin() as conn:
+                conn.exec_driver_sql(f'ALTER TABLE {table} VALIDATE CONSTRAINT "{constraint}"')
+            logger.debug("  + %s.%s now cascades on delete", table, column)
+
+        logger.info(f"✅ Foreign keys cascade on delete ({len(stale)} updated)")
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Database error updating foreign key delete actions: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    add_on_delete_cascade()
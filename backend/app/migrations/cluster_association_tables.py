@@ -0,0 +1,44 @@
+"""
+Maintenance task: physically order association tables by meal so each meal's rows share pages
+
+Not part of the startup migrations: CLUSTER rewrites the table under an ACCESS EXCLUSIVE
+lock and later inserts aren't kept in order, so run it in a maintenance window:
+    python -m app.migrations.cluster_association_tables
+"""
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+# table -> covering index to order it by
+CLUSTER_INDEXES = {
+    "meal_ingredients": "ix_meal_ingredients_cover",
+    "meal_category_mapping": "ix_meal_category_mapping_cover",
+}
+
+
+def cluster_association_tables():
+    """CLUSTER each association table on its covering index, then refresh its statistics"""
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        logger.info("⏭️ CLUSTER only applies to PostgreSQL")
+        return
+
+    for table, index in CLUSTER_INDEXES.items():
+        try:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(f"CLUSTER {table} USING {index}")
+                conn.exec_driver_sql(f"ANALYZE {table}")
+            logger.info(f"✅ Clustered {table} on {index}")
+        except SQLAlchemyError as e:
+            logger.error(f"❌ Database error clustering {table}: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    cluster_association_tables()
@@ -0,0 +1,64 @@
+"""
+Migration moving content_type columns onto the content_type_enum type (lower-case values)
+"""
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+_SELECT_STALE_TABLES = text("""
+    SELECT table_name
+    FROM information_schema.columns
+    WHERE table_schema = current_schema()
+    AND column_name = 'content_type'
+    AND udt_name <> 'content_type_enum'
+    AND table_name IN ('content_ratings', 'content_shares')
+""")
+
+_CREATE_TYPE = """
+    DO $$ BEGIN
+        IF to_regtype('content_type_enum') IS NULL THEN
+            CREATE TYPE content_type_enum AS ENUM ('recipe', 'book', 'tv_show', 'movie');
+        END IF;
+    END $$;
+"""
+
+# The old "contenttype" enum stored member names (RECIPE, TV_SHOW, ...); lower() maps them onto the values
+_ALTER_COLUMN = (
+    "ALTER TABLE {table} ALTER COLUMN content_type TYPE content_type_enum "
+    "USING lower(content_type::text)::content_type_enum"
+)
+
+
+def convert_content_type_enum():
+    """Switch content_type to content_type_enum on tables still using the name-based enum"""
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        logger.info("⏭️ content_type enum migration only runs on PostgreSQL")
+        return
+
+    try:
+        with engine.begin() as conn:
+            stale = conn.execute(_SELECT_STALE_TABLES).scalars().all()
+            if not stale:
+                logger.info("✅ content_type columns already use content_type_enum")
+                return
+
+            conn.exec_driver_sql(_CREATE_TYPE)
+            for table in stale:
+                conn.exec_driver_sql(_ALTER_COLUMN.format(table=table))
+                logger.info(f"✅ Converted {table}.content_type to content_type_enum")
+            # Nothing references the name-based type once both columns have moved
+            conn.exec_driver_sql("DROP TYPE IF EXISTS contenttype")
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Database error converting content_type columns: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    convert_content_type_enum()
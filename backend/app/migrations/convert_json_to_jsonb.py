@@ -0,0 +1,81 @@
+"""
+Migration converting json columns to jsonb on tables created before the models switched
+"""
+import logging
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+# Columns the models declare as JSONB; older databases created them as json (or, for
+# early family_members tables, as text holding JSON strings)
+JSONB_COLUMNS = {
+    "ingredients": ("nutritional_info", "allergens"),
+    "meals": ("instructions", "nutritional_info"),
+    "recipes_v2": ("ingredients_needed", "instructions", "tags"),
+    "content_ratings": ("content_specific_data",),
+    "family_members": ("dietary_restrictions", "preferences"),
+}
+
+_SELECT_JSON_COLUMNS = text("""
+    SELECT table_name, column_name, data_type
+    FROM information_schema.columns
+    WHERE table_schema = current_schema()
+    AND data_type IN ('json', 'text')
+    AND table_name IN :tables
+""").bindparams(bindparam("tables", expanding=True))
+
+
+def _to_jsonb(column: str, data_type: str) -> str:
+    """ALTER TABLE clause converting one column to jsonb"""
+    if data_type == "json":
+        # json -> jsonb is an assignment cast, so an existing column default converts too
+        return f"ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+    # A text default can't be cast to jsonb; the models supply defaults client-side anyway
+    return f"ALTER COLUMN {column} DROP DEFAULT, ALTER COLUMN {column} TYPE jsonb USING NULLIF({column}, '')::jsonb"
+
+
+def convert_json_to_jsonb():
+    """ALTER every listed column that is still json/text to jsonb (one table rewrite per table)"""
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        logger.info("⏭️ jsonb migration only runs on PostgreSQL")
+        return
+
+    try:
+        with engine.connect() as conn:
+            pending = {}
+            for table, column, data_type in conn.execute(_SELECT_JSON_COLUMNS, {"tables": list(JSONB_COLUMNS)}):
+                if column in JSONB_COLUMNS[table]:
+                    pending.setdefault(table, {})[column] = data_type
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Database error listing json columns: {e}")
+        raise
+
+    if not pending:
+        logger.info("✅ JSON columns are already jsonb")
+        return
+
+    failed = []
+    for table, columns in pending.items():
+        alterations = ", ".join(_to_jsonb(column, data_type) for column, data_type in columns.items())
+        # One transaction per table, so an unparseable row only holds back its own table
+        try:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(f"ALTER TABLE {table} {alterations}")
+        except SQLAlchemyError as e:
+            logger.error(f"❌ Database error converting {table} columns to jsonb: {e}")
+            failed.append(table)
+            continue
+        logger.info(f"✅ Converted {table}.{{{', '.join(columns)}}} to jsonb")
+
+    if failed:
+        raise RuntimeError(f"jsonb conversion failed for {failed}")
+
+
+if __name__ == "__main__":
+    convert_json_to_jsonb()
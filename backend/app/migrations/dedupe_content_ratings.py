@@ -0,0 +1,44 @@
+"""
+Remove duplicate content ratings so the uq_content_ratings_user_content index can be built
+"""
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+
+# Before rate_book became an upsert, concurrent SELECT-then-INSERT requests could store
+# several ratings for one (user, content type, item); keep the most recently written one
+_DELETE_DUPLICATE_RATINGS = text("""
+    DELETE FROM content_ratings
+    WHERE id IN (
+        SELECT id FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, content_type, COALESCE(recipe_id, book_id, tv_show_id, movie_id)
+                ORDER BY COALESCE(updated_at, created_at) DESC, id DESC
+            ) AS rn
+            FROM content_ratings
+            WHERE COALESCE(recipe_id, book_id, tv_show_id, movie_id) IS NOT NULL
+        ) ranked
+        WHERE rn > 1
+    )
+""")
+
+
+def dedupe_content_ratings():
+    """Delete all but the newest rating per user and content item"""
+    try:
+        with get_engine().begin() as conn:
+            removed = conn.execute(_DELETE_DUPLICATE_RATINGS).rowcount
+        logger.info(f"✅ Content ratings are unique per user and item ({removed} duplicate(s) removed)")
+    except SQLAlchemyError as e:
+        logger.error(f"❌ Database error removing duplicate content ratings: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    dedupe_content_ratings()
@@ -0,0 +1,54 @@
+"""
+Create indexes declared on the models that existing tables don't have yet
+
+create_all() only builds indexes together with a brand-new table, so databases created
+before an index was added to a model never get it without this step.
+"""
+import logging
+from sqlalchemy import inspect
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import Base, get_engine
+from .. import models  # noqa: F401 - registers every table on Base.metadata
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_model_indexes():
+    """Create every missing model index whose columns exist on the live table"""
+    engine = get_engine()
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = 0
+    failed = []
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables or not table.indexes:
+            continue
+
+        live_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        live_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in live_indexes:
+                continue
+            # Some deployed tables predate their model (e.g. an older meal_plans layout)
+            missing = {column.name for column in index.columns} - live_columns
+            if missing:
+                logger.warning(f"⚠️ Skipping index {index.name}: {table.name} has no column(s) {sorted(missing)}")
+                continue
+            # One transaction per index so a failure doesn't abort the rest
+            try:
+                with engine.begin() as conn:
+                    index.create(conn)
+            except SQLAlchemyError as e:
+                # e.g. a unique index over rows that still hold duplicates
+                logger.error(f"❌ Could not create index {index.name} on {table.name}: {e}")
+                failed.append(index.name)
+                continue
+            created += 1
+            logger.debug("  + Created index %s on %s", index.name, table.name)
+
+    if failed:
+        # Report the step as failed so the schema fingerprint isn't recorded and the next start retries
+        raise RuntimeError(f"{len(failed)} model index(es) could not be created: {failed}")
+    logger.info(f"✅ Model indexes up to date ({created} created)")
@@ -0,0 +1,153 @@
+"""
+Run every startup migration once
+
+Called from app startup (when RUN_MIGRATIONS is enabled) and usable as a one-shot job:
+    python -m app.migrations.run_all
+"""
+import logging
+import sys
+from typing import Optional
+
+from . import check_pending
+from .schema_meta import schema_fingerprint_matches, record_schema_fingerprint
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Bump the revision whenever a startup migration is added or changed so deployed
+# databases re-run them once
+SCHEMA_REVISION = 15
+SCHEMA_FINGERPRINT = f"{get_settings().VERSION}-r{SCHEMA_REVISION}"
+
+
+def run_migrations() -> bool:
+    """Run the startup table checks and migrations; False if any of them failed"""
+    ok = True
+    # Steps the catalog check reports as already applied are skipped
+    pending = check_pending()
+    
+    # Ensure recipe_ratings table exists
+    if pending.get("recipe_ratings", True):
+        try:
+            from .ensure_recipe_ratings_table import ensure_recipe_ratings_table
+            ensure_recipe_ratings_table()
+        except Exception as e:
+            ok = False
+            logger.warning(f"⚠️ Recipe ratings table check failed: {e}")
+    
+    # Run database migrations
+    if pending.get("dietary_restrictions", True):
+        try:
+            from .add_dietary_restrictions import add_dietary_restrictions_column
+            add_dietary_restrictions_column()
+        except Exception as e:
+            ok = False
+            logger.warning(f"⚠️ Database migration failed: {e}")
+    
+    # Update ingredient categories to new structure
+    try:
+        from .update_ingredient_categories import migrate_ingredient_categories
+        # Logs and returns False on failure rather than raising
+        if not migrate_ingredient_categories():
+            ok = False
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ Ingredient categories migration failed: {e}")
+    
+    # Add book recommendation feedback table
+    if pending.get("book_feedback", True):
+        try:
+            from .add_book_recommendation_feedback import add_book_recommendation_feedback_table
+            add_book_recommendation_feedback_table()
+        except Exception as e:
+            ok = False
+            logger.warning(f"⚠️ Book recommendation feedback table migration failed: {e}")
+    
+    # Generated content_id on content_ratings/content_shares (its index comes next)
+    try:
+        from .add_content_id_columns import add_content_id_columns
+        add_content_id_columns()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ content_id migration failed: {e}")
+    
+    # content_type onto the value-based content_type_enum
+    try:
+        from .convert_content_type_enum import convert_content_type_enum
+        convert_content_type_enum()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ content_type enum migration failed: {e}")
+    
+    # json -> jsonb before the GIN indexes below are built on those columns
+    try:
+        from .convert_json_to_jsonb import convert_json_to_jsonb
+        convert_json_to_jsonb()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ jsonb migration failed: {e}")
+    
+    # ON DELETE CASCADE on foreign keys whose parents rely on passive_deletes
+    try:
+        from .add_on_delete_cascade import add_on_delete_cascade
+        add_on_delete_cascade()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ ON DELETE CASCADE migration failed: {e}")
+    
+    # CHECK constraints added to models after their tables were created
+    try:
+        from .ensure_check_constraints import ensure_check_constraints
+        ensure_check_constraints()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ CHECK constraint migration failed: {e}")
+    
+    # Duplicate ratings would make the unique uq_content_ratings_user_content index fail to build
+    try:
+        from .dedupe_content_ratings import dedupe_content_ratings
+        dedupe_content_ratings()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ Content rating dedup failed: {e}")
+    
+    # Indexes added to models after their tables were created
+    try:
+        from .ensure_model_indexes import ensure_model_indexes
+        ensure_model_indexes()
+    except Exception as e:
+        ok = False
+        logger.warning(f"⚠️ Model index migration failed: {e}")
+    
+    return ok
+
+
+def schema_is_current() -> bool:
+    """True if the stored fingerprint matches this build's schema"""
+    return schema_fingerprint_matches(SCHEMA_FINGERPRINT)
+
+
+def run_all(schema_current: Optional[bool] = None) -> bool:
+    """Bring the schema up to date unless the stored fingerprint says it already is
+
+    ``schema_current`` lets callers pass in a fingerprint check they already ran
+    (startup reads it concurrently with init_db).
+    """
+    if schema_current is None:
+        schema_current = schema_is_current()
+    # Warm restarts against an unchanged schema skip the table checks and migrations
+    if schema_current:
+        logger.info("✅ Schema verified via fingerprint, skipping table checks and migrations")
+        return True
+    if run_migrations():
+        record_schema_fingerprint(SCHEMA_FINGERPRINT)
+        return True
+    return False
+
+
+if __name__ == "__main__":
+    from ..core.database_service import init_db
+    
+    logging.basicConfig(level=logging.INFO)
+    init_db()
+    sys.exit(0 if run_all() else 1)
@@ -0,0 +1,44 @@
+"""
+Schema fingerprint stored in the database so warm restarts can skip startup schema checks
+"""
+import logging
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.database import get_engine
+
+logger = logging.getLogger(__name__)
+
+_CREATE_META = text("""
+    CREATE TABLE IF NOT EXISTS schema_meta (
+        id INTEGER PRIMARY KEY,
+        schema_version TEXT NOT NULL
+    )
+""")
+_SELECT_VERSION = text("SELECT schema_version FROM schema_meta WHERE id = 1")
+_UPSERT_VERSION = text("""
+    INSERT INTO schema_meta (id, schema_version) VALUES (1, :version)
+    ON CONFLICT (id) DO UPDATE SET schema_version = excluded.schema_version
+""")
+
+
+def schema_fingerprint_matches(fingerprint: str) -> bool:
+    """True if the stored fingerprint equals ``fingerprint`` (one primary-key read)"""
+    try:
+        with get_engine().connect() as conn:
+            stored = conn.execute(_SELECT_VERSION).scalar()
+    except SQLAlchemyError:
+        # schema_meta doesn't exist yet (first boot on this database)
+        return False
+    return stored == fingerprint
+
+
+def record_schema_fingerprint(fingerprint: str) -> None:
+    """Store ``fingerprint`` after the startup schema checks have all succeeded"""
+    try:
+        with get_engine().begin() as conn:
+            conn.execute(_CREATE_META)
+            conn.execute(_UPSERT_VERSION, {"version": fingerprint})
+        logger.info(f"✅ Recorded schema fingerprint {fingerprint}")
+    except SQLAlchemyError as e:
+        logger.warning(f"⚠️ Could not record schema fingerprint: {e}")
@@ -3,106 +3,186 @@ Migration to update ingredient categories from old structure to new improved str
 Handles existing data by migrating ingredients from old categories to new ones
 """
 import logging
-from sqlalchemy import text
+from itertools import groupby
+from operator import attrgetter
+from types import MappingProxyType
+from sqlalchemy import String, and_, bindparam, cast, column, delete, exists, func, insert, or_, select, text, tuple_, update, values
+from sqlalchemy.dialects.postgresql import UUID
 from app.core.database_service import get_db_session
 from app.models.ingredient import IngredientCategory, Ingredient
 from app.data.ingredients_data import INGREDIENT_CATEGORIES, INGREDIENTS_DATA
 
 logger = logging.getLogger(__name__)
 
+# Same name PostgreSQL gives the model's unique=True constraint, so this is a no-op on
+# tables create_all built and only adds the index to tables that predate it
+_ENSURE_UNIQUE_CATEGORY_NAME = text(
+    "CREATE UNIQUE INDEX IF NOT EXISTS ingredient_categories_name_key ON ingredient_categories (name)"
+)
+
+# Old category name -> new category name, or -> {ingredient name: new category name}
+# for categories whose ingredients are split up (read-only, built once at import)
+CATEGORY_MAPPING = MappingProxyType({
+    "Proteins": MappingProxyType({
+        # Meat & Poultry
+        "Chicken Breast": "Meat & Poultry",
+        "Chicken Thighs": "Meat & Poultry", 
+        "Ground Beef": "Meat & Poultry",
+        "Ground Turkey": "Meat & Poultry",
+        "Pork Chops": "Meat & Poultry",
+        "Turkey Breast": "Meat & Poultry",
+        "Ham": "Meat & Poultry",
+        "Bacon": "Meat & Poultry",
+        
+        # Fish & Seafood
+        "Salmon": "Fish & Seafood",
+        "Tuna": "Fish & Seafood",
+        "Cod": "Fish & Seafood", 
+        "Shrimp": "Fish & Seafood",
+        "Crab": "Fish & Seafood",
+        
+        # Legumes & Plant Proteins
+        "Black Beans": "Legumes & Plant Proteins",
+        "Kidney Beans": "Legumes & Plant Proteins",
+        "Chickpeas": "Legumes & Plant Proteins",
+        "Lentils": "Legumes & Plant Proteins",
+        "Tofu": "Legumes & Plant Proteins",
+        "Tempeh": "Legumes & Plant Proteins",
+        "Protein Powder": "Legumes & Plant Proteins",
+        
+        # Eggs & Dairy Proteins  
+        "Eggs": "Eggs & Dairy Proteins",
+        "Egg Whites": "Eggs & Dairy Proteins",
+        "Greek Yogurt": "Eggs & Dairy Proteins",
+        "Cottage Cheese": "Eggs & Dairy Proteins",
+    }),
+    "Grains": "Grains & Starches",
+    "Spices & Herbs": "Herbs & Spices",
+    # Dairy category moves some items to new protein categories, but keeps most
+    "Dairy": MappingProxyType({
+        "Greek Yogurt": "Eggs & Dairy Proteins",
+        "Cottage Cheese": "Eggs & Dairy Proteins",
+        # All other dairy items stay in Dairy category
+    })
+})
+
+# Flattened mapping: whole-category moves (e.g. "Grains" -> "Grains & Starches")
+# and per-ingredient moves keyed by (old category, ingredient name)
+_SIMPLE_MAP = MappingProxyType({old: new for old, new in CATEGORY_MAPPING.items() if isinstance(new, str)})
+_PAIR_MAP = MappingProxyType({
+    (old, ingredient_name): new
+    for old, mapping in CATEGORY_MAPPING.items() if not isinstance(mapping, str)
+    for ingredient_name, new in mapping.items()
+})
+
+
+def _group_moves():
+    """(old, new) -> ingredient names to move, None meaning the whole category"""
+    # Unmapped items (e.g. most of Dairy) appear nowhere here, so they stay put
+    moves = {pair: None for pair in _SIMPLE_MAP.items()}
+    for (old_cat_name, ingredient_name), new_category_name in _PAIR_MAP.items():
+        moves.setdefault((old_cat_name, new_category_name), []).append(ingredient_name)
+    return MappingProxyType(moves)
+
+
+_MOVES = _group_moves()
+
+_SEED_INGREDIENT_NAMES = frozenset(name for name, _, _, _ in INGREDIENTS_DATA)
+
+# Fixed-shape statements, built once so SQLAlchemy's compiled cache is reused across runs
+_INSERT_INGREDIENTS = insert(Ingredient)
+_MOVE_CATEGORY = (
+    update(Ingredient)
+    .where(Ingredient.category_id == bindparam("old_id"))
+    .values(category_id=bindparam("new_id"))
+)
+_MOVE_NAMED_INGREDIENTS = _MOVE_CATEGORY.where(Ingredient.name.in_(bindparam("names", expanding=True)))
+# Old-structure categories that no ingredient references any more
+_EMPTY_OLD_CATEGORY = and_(
+    IngredientCategory.name.in_(["Proteins"]),
+    ~exists().where(Ingredient.category_id == IngredientCategory.id)
+)
+_DELETE_EMPTY_OLD_CATEGORIES = delete(IngredientCategory).where(_EMPTY_OLD_CATEGORY)
+# Any category name stored more than once (the unique index can't be built until Step 0 merges them)
+_HAS_DUPLICATE_CATEGORIES = select(IngredientCategory.name).group_by(
+    IngredientCategory.name
+).having(func.count() > 1).exists()
+# Any ingredient still sitting where CATEGORY_MAPPING says it should move from
+_PENDING_MOVES = exists().where(
+    Ingredient.category_id == IngredientCategory.id,
+    or_(
+        IngredientCategory.name.in_(list(_SIMPLE_MAP)),
+        tuple_(IngredientCategory.name, Ingredient.name).in_(list(_PAIR_MAP))
+    )
+)
+
+
 def migrate_ingredient_categories():
     """Update ingredient categories to new improved structure"""
     logger.info("🔄 Starting ingredient category migration...")
     
     try:
         with get_db_session() as session:
+            # Fast path: one round-trip to confirm nothing is left to move, create, insert or delete
+            has_moves, category_count, ingredient_count, has_empty_old, has_duplicates = session.execute(select(
+                _PENDING_MOVES,
+                select(func.count()).select_from(IngredientCategory)
+                .where(IngredientCategory.name.in_(INGREDIENT_CATEGORIES)).scalar_subquery(),
+                select(func.count()).select_from(Ingredient)
+                .where(Ingredient.name.in_(_SEED_INGREDIENT_NAMES)).scalar_subquery(),
+                exists().where(_EMPTY_OLD_CATEGORY),
+                _HAS_DUPLICATE_CATEGORIES
+            )).one()
+            if (not has_moves and not has_empty_old and not has_duplicates
+                    and category_count == len(INGREDIENT_CATEGORIES)
+                    and ingredient_count == len(_SEED_INGREDIENT_NAMES)):
+                # Migrated tables that predate the unique index still need it
+                session.execute(_ENSURE_UNIQUE_CATEGORY_NAME)
+                logger.info("✅ Ingredient categories already migrated, nothing to do")
+                return True
+            
             # Step 0: Clean up any duplicate categories first
             logger.info("🧹 Cleaning up duplicate categories...")
             
-            # Find duplicate categories
-            from sqlalchemy import func
-            duplicates = session.query(
-                IngredientCategory.name,
-                func.count(IngredientCategory.id).label('count')
-            ).group_by(IngredientCategory.name).having(func.count(IngredientCategory.id) > 1).all()
-            
-            for dup_name, count in duplicates:
-                logger.info(f"Found {count} duplicates of category: {dup_name}")
-                dup_categories = session.query(IngredientCategory).filter(
-                    IngredientCategory.name == dup_name
-                ).all()
+            # Load every row of every duplicated name in one query, grouped by name
+            duplicate_names = session.query(IngredientCategory.name).group_by(
+                IngredientCategory.name
+            ).having(func.count(IngredientCategory.id) > 1)
+            duplicate_rows = session.query(IngredientCategory).filter(
+                IngredientCategory.name.in_(duplicate_names)
+            ).order_by(IngredientCategory.name, IngredientCategory.id).all()
+            
+            for dup_name, group in groupby(duplicate_rows, key=attrgetter("name")):
+                dup_categories = list(group)
+                logger.info(f"Found {len(dup_categories)} duplicates of category: {dup_name}")
                 
-                # Keep the first one, merge ingredients to it, delete the rest
+                # Keep the first one, move every ingredient on the others to it, delete the rest
                 keep_category = dup_categories[0]
-                for dup_cat in dup_categories[1:]:
-                    # Move all ingredients from duplicate to the kept category
-                    ingredients_to_move = session.query(Ingredient).filter(
-                        Ingredient.category_id == dup_cat.id
-                    ).all()
-                    
-                    for ing in ingredients_to_move:
-                        ing.category_id = keep_category.id
-                        logger.info(f"  → Moved '{ing.name}' from duplicate {dup_name} to main category")
-                    
-                    # Delete the duplicate category
-                    session.delete(dup_cat)
-                    logger.info(f"  - Deleted duplicate category: {dup_name}")
+                dup_ids = [dup_cat.id for dup_cat in dup_categories[1:]]
+                moved = session.execute(
+                    update(Ingredient)
+                    .where(Ingredient.category_id.in_(dup_ids))
+                    .values(category_id=keep_category.id),
+                    execution_options={"synchronize_session": False}
+                ).rowcount
+                session.execute(
+                    delete(IngredientCategory).where(IngredientCategory.id.in_(dup_ids)),
+                    execution_options={"synchronize_session": False}
+                )
+                logger.info(f"  - Moved {moved} ingredients and deleted {len(dup_ids)} duplicates of {dup_name}")
             
-            session.commit()
+            # With duplicates gone, enforce uniqueness so the cleanup above finds nothing from now on
+            session.execute(_ENSURE_UNIQUE_CATEGORY_NAME)
             logger.info("✅ Duplicate cleanup complete")
             
             # Get fresh state after cleanup
             existing_categories = session.query(IngredientCategory).all()
             existing_cat_names = {cat.name for cat in existing_categories}
-            existing_ingredients = session.query(Ingredient).all()
+            # Names are all the later steps read from existing ingredients
+            existing_ingredient_names = set(session.scalars(select(Ingredient.name)))
             
             logger.info(f"Found {len(existing_categories)} existing categories: {list(existing_cat_names)}")
-            logger.info(f"Found {len(existing_ingredients)} existing ingredients")
-            
-            # Create mapping of old category names to new category names
-            category_mapping = {
-                "Proteins": {
-                    # Meat & Poultry
-                    "Chicken Breast": "Meat & Poultry",
-                    "Chicken Thighs": "Meat & Poultry", 
-                    "Ground Beef": "Meat & Poultry",
-                    "Ground Turkey": "Meat & Poultry",
-                    "Pork Chops": "Meat & Poultry",
-                    "Turkey Breast": "Meat & Poultry",
-                    "Ham": "Meat & Poultry",
-                    "Bacon": "Meat & Poultry",
-                    
-                    # Fish & Seafood
-                    "Salmon": "Fish & Seafood",
-                    "Tuna": "Fish & Seafood",
-                    "Cod": "Fish & Seafood", 
-                    "Shrimp": "Fish & Seafood",
-                    "Crab": "Fish & Seafood",
-                    
-                    # Legumes & Plant Proteins
-                    "Black Beans": "Legumes & Plant Proteins",
-                    "Kidney Beans": "Legumes & Plant Proteins",
-                    "Chickpeas": "Legumes & Plant Proteins",
-                    "Lentils": "Legumes & Plant Proteins",
-                    "Tofu": "Legumes & Plant Proteins",
-                    "Tempeh": "Legumes & Plant Proteins",
-                    "Protein Powder": "Legumes & Plant Proteins",
-                    
-                    # Eggs & Dairy Proteins  
-                    "Eggs": "Eggs & Dairy Proteins",
-                    "Egg Whites": "Eggs & Dairy Proteins",
-                    "Greek Yogurt": "Eggs & Dairy Proteins",
-                    "Cottage Cheese": "Eggs & Dairy Proteins",
-                },
-                "Grains": "Grains & Starches",
-                "Spices & Herbs": "Herbs & Spices",
-                # Dairy category moves some items to new protein categories, but keeps most
-                "Dairy": {
-                    "Greek Yogurt": "Eggs & Dairy Proteins",
-                    "Cottage Cheese": "Eggs & Dairy Proteins",
-                    # All other dairy items stay in Dairy category
-                }
-            }
+            logger.info(f"Found {len(existing_ingredient_names)} existing ingredients")
             
             # Step 1: Create new categories that don't exist (avoiding duplicates)
             category_objects = {cat.name: cat for cat in existing_categories}
@@ -115,77 +195,90 @@ def migrate_ingredient_categories():
                     session.flush()  # Get the ID
                     category_objects[cat_name] = category
                     new_categories_created += 1
-                    logger.info(f"  + Created category: {cat_name}")
+                    logger.debug("  + Created category: %s", cat_name)
+            
+            # Plain name -> id lookup for Steps 2 and 3
+            cat_id_by_name = {name: cat.id for name, cat in category_objects.items()}
             
-            # Commit new categories
             if new_categories_created > 0:
-                session.commit()
                 logger.info(f"✅ Created {new_categories_created} new categories")
             
-            # Step 2: Migrate existing ingredients to new categories
+            # Step 2: Migrate existing ingredients to new categories with set-based UPDATEs
+            # instead of one per ingredient
             migrated_count = 0
+            if session.get_bind().dialect.name == "postgresql":
+                # PostgreSQL: the whole remap is one UPDATE ... FROM (VALUES (old_id, name, new_id), ...),
+                # where a NULL name moves every ingredient in the old category
+                remap_rows = [
+                    (str(cat_id_by_name[old]), name, str(cat_id_by_name[new]))
+                    for (old, new), names in _MOVES.items()
+                    if old in cat_id_by_name and new in cat_id_by_name
+                    for name in (names or [None])
+                ]
+                if remap_rows:
+                    remap = values(
+                        column("old_id", String), column("name", String), column("new_id", String),
+                        name="remap"
+                    ).data(remap_rows)
+                    migrated_count = session.execute(
+                        update(Ingredient)
+                        .where(
+                            Ingredient.category_id == cast(remap.c.old_id, UUID),
+                            or_(remap.c.name.is_(None), Ingredient.name == remap.c.name)
+                        )
+                        .values(category_id=cast(remap.c.new_id, UUID)),
+                        execution_options={"synchronize_session": False}
+                    ).rowcount
+                    logger.info(f"  → Moved {migrated_count} ingredients to their new categories")
+            else:
+                # Other databases: one bulk UPDATE per (old, new) category pair
+                for (old_cat_name, new_category_name), ingredient_names in _MOVES.items():
+                    old_category_id = cat_id_by_name.get(old_cat_name)
+                    new_category_id = cat_id_by_name.get(new_category_name)
+                    if not old_category_id or not new_category_id:
+                        continue
+                    params = {"old_id": old_category_id, "new_id": new_category_id}
+                    if ingredient_names is None:
+                        stmt = _MOVE_CATEGORY
+                    else:
+                        stmt = _MOVE_NAMED_INGREDIENTS
+                        params["names"] = ingredient_names
+                    # No Ingredient objects live in this session, so there is nothing to sync
+                    result = session.execute(stmt, params, execution_options={"synchronize_session": False})
+                    if result.rowcount:
+                        migrated_count += result.rowcount
+                        logger.info(f"  → Moved {result.rowcount} ingredients from '{old_cat_name}' to '{new_category_name}'")
             
-            for ingredient in existing_ingredients:
-                old_category = ingredient.category
-                if not old_category:
-                    continue
-                    
-                new_category_name = None
-                
-                # Check if this ingredient needs to be moved
-                if old_category.name in category_mapping:
-                    mapping = category_mapping[old_category.name]
-                    
-                    if isinstance(mapping, str):
-                        # Simple mapping (e.g., "Grains" -> "Grains & Starches")
-                        new_category_name = mapping
-                    elif isinstance(mapping, dict):
-                        # Complex mapping based on ingredient name
-                        new_category_name = mapping.get(ingredient.name)
-                        
-                        # For Dairy category, if not explicitly mapped, keep in Dairy
-                        if old_category.name == "Dairy" and not new_category_name:
-                            continue  # Stay in Dairy
-                
-                # Update ingredient category if mapping found
-                if new_category_name and new_category_name in category_objects:
-                    old_cat_name = old_category.name
-                    ingredient.category_id = category_objects[new_category_name].id
-                    migrated_count += 1
-                    logger.info(f"  → Moved '{ingredient.name}' from '{old_cat_name}' to '{new_category_name}'")
-            
-            # Step 3: Add any missing ingredients from centralized data
-            existing_ingredient_names = {ing.name for ing in existing_ingredients}
-            added_count = 0
-            
-            for name, category_name, unit, nutrition in INGREDIENTS_DATA:
-                if name not in existing_ingredient_names and category_name in category_objects:
-                    ingredient = Ingredient(
-                        name=name,
-                        category_id=category_objects[category_name].id,
-                        unit=unit,
-                        nutritional_info=nutrition,
-                        allergens=[]
-                    )
-                    session.add(ingredient)
-                    added_count += 1
-                    logger.info(f"  + Added new ingredient: {name} ({category_name})")
-            
-            # Step 4: Remove empty old categories
-            removed_categories = 0
-            for category in existing_categories:
-                # Refresh ingredient count
-                ingredient_count = session.query(Ingredient).filter(
-                    Ingredient.category_id == category.id
-                ).count()
-                
-                # Remove category if it's empty and was part of old structure
-                if ingredient_count == 0 and category.name in ["Proteins"]:
-                    session.delete(category)
-                    removed_categories += 1
-                    logger.info(f"  - Removed empty category: {category.name}")
+            # Step 3: Add any missing ingredients from centralized data in one bulk INSERT
+            new_rows = [
+                {
+                    "name": name,
+                    "category_id": cat_id_by_name[category_name],
+                    "unit": unit,
+                    "nutritional_info": nutrition._asdict(),
+                    "allergens": []
+                }
+                for name, category_name, unit, nutrition in INGREDIENTS_DATA
+                if name not in existing_ingredient_names and category_name in cat_id_by_name
+            ]
+            if new_rows:
+                session.execute(_INSERT_INGREDIENTS, new_rows)
+            added_count = len(new_rows)
+            for row in new_rows:
+                logger.debug("  + Added new ingredient: %s", row["name"])
+            if added_count > 0:
+                logger.info(f"✅ Added {added_count} new ingredients")
+            
+            # Step 4: Remove empty old categories in one DELETE guarded by NOT EXISTS
+            result = session.execute(
+                _DELETE_EMPTY_OLD_CATEGORIES,
+                execution_options={"synchronize_session": False}
+            )
+            removed_categories = result.rowcount
+            if removed_categories:
+                logger.info(f"  - Removed {removed_categories} empty old categories")
             
-            # Commit all changes
+            # Commit all changes - the whole migration is one transaction, so a failure rolls it all back
             session.commit()
             
             # Final summary
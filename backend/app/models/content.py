@@ -1,14 +1,12 @@
 """
 Unified content models for books, TV shows, movies, and recipes
 """
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, JSON, Boolean, Enum
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, JSON, Boolean, Enum, Index, Computed, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred, relationship
 import enum
 
-from ..db.database import Base
+from ..db.database import Base, uuid7, TS_NOW
 
 
 class ContentType(enum.Enum):
@@ -19,19 +17,33 @@ class ContentType(enum.Enum):
     MOVIE = "movie"
 
 
+# Native Postgres enum holding the lower-case values, as the API and schemas use them
+_CONTENT_TYPE_ENUM = Enum(
+    ContentType,
+    name="content_type_enum",
+    values_callable=lambda members: [member.value for member in members],
+    native_enum=True
+)
+
+# Generated-column expression shared by ContentRating and ContentShare
+_CONTENT_ID_SQL = "COALESCE(recipe_id, book_id, tv_show_id, movie_id)"
+# Exactly one typed content column set, so content_id always names the row's item
+_ONE_CONTENT_SQL = "num_nonnulls(recipe_id, book_id, tv_show_id, movie_id) = 1"
+
+
 class Book(Base):
     """
     Book model for tracking user's reading collection
     """
     __tablename__ = "books"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Basic book information
     title = Column(String(500), nullable=False)
     author = Column(String(300), nullable=False)
-    description = Column(Text)
+    description = deferred(Column(Text), group="details")
     genre = Column(String(100))
     isbn = Column(String(20))
     pages = Column(Integer)
@@ -47,17 +59,17 @@ class Book(Base):
     reading_status = Column(String(50), default="want_to_read")  # want_to_read, reading, read
     date_started = Column(DateTime(timezone=True))
     date_finished = Column(DateTime(timezone=True))
-    user_notes = Column(Text)
+    user_notes = deferred(Column(Text), group="details")
     is_favorite = Column(Boolean, default=False)
     
     # Metadata
     source = Column(String(100), default="user_added")  # user_added, google_books, open_library
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     user = relationship("User", back_populates="books")
-    ratings = relationship("ContentRating", back_populates="book", cascade="all, delete-orphan")
+    ratings = relationship("ContentRating", back_populates="book", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class TVShow(Base):
@@ -66,12 +78,12 @@ class TVShow(Base):
     """
     __tablename__ = "tv_shows"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Basic show information
     title = Column(String(500), nullable=False)
-    description = Column(Text)
+    description = deferred(Column(Text), group="details")
     genre = Column(String(100))
     network = Column(String(100))
     total_seasons = Column(Integer)
@@ -93,18 +105,24 @@ class TVShow(Base):
     episodes_watched = Column(Integer, default=0)
     date_started = Column(DateTime(timezone=True))
     date_finished = Column(DateTime(timezone=True))
-    user_notes = Column(Text)
+    user_notes = deferred(Column(Text), group="details")
     is_favorite = Column(Boolean, default=False)
     
     # Metadata
     source = Column(String(100), default="user_added")  # user_added, tmdb, tvmaze
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     user = relationship("User", back_populates="tv_shows")
-    ratings = relationship("ContentRating", back_populates="tv_show", cascade="all, delete-orphan")
-    episode_watches = relationship("EpisodeWatch", back_populates="tv_show", cascade="all, delete-orphan")
+    ratings = relationship("ContentRating", back_populates="tv_show", cascade="all, delete-orphan", passive_deletes=True)
+    episode_watches = relationship(
+        "EpisodeWatch",
+        back_populates="tv_show",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="(EpisodeWatch.season_number, EpisodeWatch.episode_number)"
+    )
 
 
 class Movie(Base):
@@ -113,12 +131,12 @@ class Movie(Base):
     """
     __tablename__ = "movies"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Basic movie information
     title = Column(String(500), nullable=False)
-    description = Column(Text)
+    description = deferred(Column(Text), group="details")
     genre = Column(String(100))
     director = Column(String(200))
     release_year = Column(Integer)
@@ -133,17 +151,17 @@ class Movie(Base):
     # User-specific data
     viewing_status = Column(String(50), default="want_to_watch")  # want_to_watch, watched
     date_watched = Column(DateTime(timezone=True))
-    user_notes = Column(Text)
+    user_notes = deferred(Column(Text), group="details")
     is_favorite = Column(Boolean, default=False)
     
     # Metadata
     source = Column(String(100), default="user_added")  # user_added, tmdb, omdb
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     user = relationship("User", back_populates="movies")
-    ratings = relationship("ContentRating", back_populates="movie", cascade="all, delete-orphan")
+    ratings = relationship("ContentRating", back_populates="movie", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class ContentRating(Base):
@@ -151,8 +169,21 @@ class ContentRating(Base):
     Unified rating system for all content types
     """
     __tablename__ = "content_ratings"
+    __table_args__ = (
+        # A user's ratings, filtered by type and listed newest first
+        Index("ix_content_ratings_user_type_created", "user_id", "content_type", "created_at"),
+        Index("ix_content_ratings_type_content", "content_type", "content_id"),
+        # Lookups by rated item; each column is only set on rows of its own type
+        Index("ix_content_ratings_recipe_id", "recipe_id", postgresql_where=text("recipe_id IS NOT NULL")),
+        Index("ix_content_ratings_book_id", "book_id", postgresql_where=text("book_id IS NOT NULL")),
+        Index("ix_content_ratings_tv_show_id", "tv_show_id", postgresql_where=text("tv_show_id IS NOT NULL")),
+        Index("ix_content_ratings_movie_id", "movie_id", postgresql_where=text("movie_id IS NOT NULL")),
+        # One rating per user and item; the ON CONFLICT target for saving a rating
+        Index("uq_content_ratings_user_content", "user_id", "content_type", "content_id", unique=True),
+        CheckConstraint(_ONE_CONTENT_SQL, name="ck_content_ratings_one_content").ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     # Content references (only one should be set)
@@ -160,20 +191,22 @@ class ContentRating(Base):
     book_id = Column(UUID(as_uuid=True), ForeignKey("books.id", ondelete="CASCADE"), nullable=True)
     tv_show_id = Column(UUID(as_uuid=True), ForeignKey("tv_shows.id", ondelete="CASCADE"), nullable=True)
     movie_id = Column(UUID(as_uuid=True), ForeignKey("movies.id", ondelete="CASCADE"), nullable=True)
+    # Whichever of the above is set, computed by the database
+    content_id = Column(UUID(as_uuid=True), Computed(_CONTENT_ID_SQL, persisted=True))
     
     # Content type for easy querying
-    content_type = Column(Enum(ContentType), nullable=False)
+    content_type = Column(_CONTENT_TYPE_ENUM, nullable=False)
     
     # Rating data
     rating = Column(Integer, nullable=False)  # 1-5 stars
-    review_text = Column(Text)
+    review_text = deferred(Column(Text), group="details")
     
     # Content-specific fields (JSON for flexibility)
-    content_specific_data = Column(JSON, default=dict)  # For content-specific rating data
+    content_specific_data = Column(JSONB, default=dict)  # For content-specific rating data
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     user = relationship("User")
@@ -188,10 +221,16 @@ class EpisodeWatch(Base):
     Track individual episode watches for TV shows
     """
     __tablename__ = "episode_watches"
+    __table_args__ = (
+        # Watch-history range scans; watch dates follow insertion order closely enough for BRIN
+        Index("ix_episode_watch_date_brin", "watch_date", postgresql_using="brin"),
+        # One row per user and episode; leads with user_id, so it also serves per-user lookups
+        Index("uq_episode_watch", "user_id", "tv_show_id", "season_number", "episode_number", unique=True),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    tv_show_id = Column(UUID(as_uuid=True), ForeignKey("tv_shows.id", ondelete="CASCADE"), nullable=False)
+    tv_show_id = Column(UUID(as_uuid=True), ForeignKey("tv_shows.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Episode identification
     season_number = Column(Integer, nullable=False)
@@ -203,8 +242,8 @@ class EpisodeWatch(Base):
     watch_date = Column(DateTime(timezone=True))
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     user = relationship("User")
@@ -217,8 +256,8 @@ class BookRecommendationFeedback(Base):
     """
     __tablename__ = "book_recommendation_feedback"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Recommendation details
     recommendation_session_id = Column(String(100), nullable=False)  # Group recommendations by session
@@ -238,8 +277,8 @@ class BookRecommendationFeedback(Base):
     context_feedback_history = Column(JSON, default=dict)  # Previous feedback patterns
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     user = relationship("User", back_populates="book_recommendation_feedback")
@@ -250,8 +289,15 @@ class ContentShare(Base):
     Universal content sharing system
     """
     __tablename__ = "content_shares"
+    __table_args__ = (
+        # "Shared with me" and "shared by me" lists only ever show active shares
+        Index("ix_content_shares_with_active_created", "shared_with_user_id", "is_active", "created_at"),
+        Index("ix_content_shares_by_active_created", "shared_by_user_id", "is_active", "created_at"),
+        Index("ix_content_shares_type_content", "content_type", "content_id"),
+        CheckConstraint(_ONE_CONTENT_SQL, name="ck_content_shares_one_content").ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     shared_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     shared_with_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
@@ -260,17 +306,19 @@ class ContentShare(Base):
     book_id = Column(UUID(as_uuid=True), ForeignKey("books.id", ondelete="CASCADE"), nullable=True)
     tv_show_id = Column(UUID(as_uuid=True), ForeignKey("tv_shows.id", ondelete="CASCADE"), nullable=True)
     movie_id = Column(UUID(as_uuid=True), ForeignKey("movies.id", ondelete="CASCADE"), nullable=True)
+    # Whichever of the above is set, computed by the database
+    content_id = Column(UUID(as_uuid=True), Computed(_CONTENT_ID_SQL, persisted=True))
     
     # Content type for easy querying
-    content_type = Column(Enum(ContentType), nullable=False)
+    content_type = Column(_CONTENT_TYPE_ENUM, nullable=False)
     
     # Sharing metadata
     share_message = Column(Text)
     is_active = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     shared_by = relationship("User", foreign_keys=[shared_by_user_id])
@@ -1,25 +1,24 @@
-from sqlalchemy import Column, String, DateTime, JSON, Integer, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import uuid
 
-from app.db.database import Base
+from app.db.database import Base, TS_NOW
 
 
 class FamilyMember(Base):
     __tablename__ = "family_members"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     age = Column(Integer)
-    dietary_restrictions = Column(JSON, default=[])  # Added for test compatibility
-    preferences = Column(JSON, default={})
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    dietary_restrictions = Column(JSONB, default=[])  # Added for test compatibility
+    preferences = Column(JSONB, default={})
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
 
     user = relationship("User", back_populates="family_members")
-    meal_attendance = relationship("MealAttendance", back_populates="family_member", cascade="all, delete-orphan")
+    meal_attendance = relationship("MealAttendance", back_populates="family_member", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class DietaryRestriction(Base):
@@ -1,10 +1,9 @@
-from sqlalchemy import Column, String, DateTime, JSON, Float, ForeignKey, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import uuid
 
-from app.db.database import Base
+from app.db.database import Base, TS_NOW
 
 
 class IngredientCategory(Base):
@@ -12,7 +11,7 @@ class IngredientCategory(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False, unique=True)
-    parent_category_id = Column(UUID(as_uuid=True), ForeignKey("ingredient_categories.id"))
+    parent_category_id = Column(UUID(as_uuid=True), ForeignKey("ingredient_categories.id"), index=True)
 
     parent_category = relationship("IngredientCategory", remote_side=[id])
     subcategories = relationship("IngredientCategory", back_populates="parent_category")
@@ -21,13 +20,17 @@ class IngredientCategory(Base):
 
 class Ingredient(Base):
     __tablename__ = "ingredients"
+    __table_args__ = (
+        # Allergen containment filters (allergens @> '["nuts"]')
+        Index("ix_ingredient_allergens_gin", "allergens", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False, unique=True, index=True)
-    category_id = Column(UUID(as_uuid=True), ForeignKey("ingredient_categories.id"))
+    category_id = Column(UUID(as_uuid=True), ForeignKey("ingredient_categories.id"), index=True)
     unit = Column(String, nullable=False)  # grams, cups, pieces, etc.
-    nutritional_info = Column(JSON, default={})
-    allergens = Column(JSON, default=[])  # list of allergen names
+    nutritional_info = Column(JSONB, default={})
+    allergens = Column(JSONB, default=[])  # list of allergen names
 
     category = relationship("IngredientCategory", back_populates="ingredients")
     pantry_items = relationship("PantryItem", back_populates="ingredient")
@@ -37,11 +40,11 @@ class Ingredient(Base):
 class PantryItem(Base):
     __tablename__ = "user_pantry"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
-    ingredient_id = Column(UUID(as_uuid=True), ForeignKey("ingredients.id"), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    ingredient_id = Column(UUID(as_uuid=True), ForeignKey("ingredients.id"), primary_key=True, index=True)
     quantity = Column(Float, nullable=False, default=0)
     expiration_date = Column(DateTime(timezone=True))
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     user = relationship("User", back_populates="pantry_items")
     ingredient = relationship("Ingredient", back_populates="pantry_items")
\ No newline at end of file
@@ -1,16 +1,17 @@
-from sqlalchemy import Column, String, DateTime, JSON, Integer, Float, ForeignKey, Table, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, Table, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import uuid
 
-from app.db.database import Base
+from app.db.database import Base, TS_NOW
 
 meal_category_mapping = Table(
     'meal_category_mapping',
     Base.metadata,
     Column('meal_id', UUID(as_uuid=True), ForeignKey('meals.id')),
-    Column('category_id', UUID(as_uuid=True), ForeignKey('meal_categories.id'))
+    Column('category_id', UUID(as_uuid=True), ForeignKey('meal_categories.id'), index=True),
+    # A meal's categories straight from the index, no heap visits
+    Index('ix_meal_category_mapping_cover', 'meal_id', postgresql_include=['category_id'])
 )
 
 
@@ -24,29 +25,40 @@ class Meal(Base):
     cook_time = Column(Integer, nullable=False)  # minutes
     difficulty = Column(Integer, nullable=False)  # 1-5 scale
     servings = Column(Integer, nullable=False, default=4)
-    instructions = Column(JSON, default=[])  # list of instruction steps
+    instructions = Column(JSONB, default=[])  # list of instruction steps
     image_url = Column(String)
-    nutritional_info = Column(JSON, default={})
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    nutritional_info = Column(JSONB, default={})
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
 
-    ingredients = relationship("MealIngredient", back_populates="meal", cascade="all, delete-orphan")
+    # Stable order from the database: ingredient_id is the second column of the (meal_id, ingredient_id) key
+    ingredients = relationship(
+        "MealIngredient",
+        back_populates="meal",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="MealIngredient.ingredient_id"
+    )
     categories = relationship("MealCategory", secondary=meal_category_mapping, back_populates="meals")
-    planned_meals = relationship("PlannedMeal", back_populates="meal", cascade="all, delete-orphan")
-    meal_ratings = relationship("MealRating", back_populates="meal", cascade="all, delete-orphan")
-    recommendation_history = relationship("RecommendationHistory", back_populates="meal", cascade="all, delete-orphan")
+    planned_meals = relationship("PlannedMeal", back_populates="meal", cascade="all, delete-orphan", passive_deletes=True)
+    meal_ratings = relationship("MealRating", back_populates="meal", cascade="all, delete-orphan", passive_deletes=True)
+    recommendation_history = relationship("RecommendationHistory", back_populates="meal", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class MealIngredient(Base):
     __tablename__ = "meal_ingredients"
+    __table_args__ = (
+        # "All ingredients of meal X" as an index-only scan
+        Index("ix_meal_ingredients_cover", "meal_id", postgresql_include=["ingredient_id", "quantity", "unit", "optional"]),
+    )
 
-    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id"), primary_key=True)
-    ingredient_id = Column(UUID(as_uuid=True), ForeignKey("ingredients.id"), primary_key=True)
+    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id", ondelete="CASCADE"), primary_key=True)
+    ingredient_id = Column(UUID(as_uuid=True), ForeignKey("ingredients.id"), primary_key=True, index=True)
     quantity = Column(Float, nullable=False)
     unit = Column(String, nullable=False)
     optional = Column(Boolean, default=False)
 
     meal = relationship("Meal", back_populates="ingredients")
-    ingredient = relationship("Ingredient", back_populates="meal_ingredients")
+    ingredient = relationship("Ingredient", back_populates="meal_ingredients", lazy="joined")
 
 
 class MealCategory(Base):
@@ -1,44 +1,52 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Date
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Date, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
 
-from app.db.database import Base
+from app.db.database import Base, uuid7, TS_NOW
 
 
 class MealPlan(Base):
     __tablename__ = "meal_plans"
+    __table_args__ = (
+        Index("ix_meal_plans_user_week", "user_id", "week_start_date"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     week_start_date = Column(Date, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
 
     user = relationship("User", back_populates="meal_plans")
-    planned_meals = relationship("PlannedMeal", back_populates="plan", cascade="all, delete-orphan")
+    planned_meals = relationship("PlannedMeal", back_populates="plan", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class PlannedMeal(Base):
     __tablename__ = "planned_meals"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    plan_id = Column(UUID(as_uuid=True), ForeignKey("meal_plans.id"), nullable=False)
-    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id"), nullable=False)
+    __table_args__ = (
+        # A plan's meals by day and slot
+        Index("ix_planned_meals_plan_date", "plan_id", "date", "meal_type"),
+        # Date-range scans across plans; rows arrive roughly in date order, so BRIN stays tiny
+        Index("ix_planned_meals_date_brin", "date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    plan_id = Column(UUID(as_uuid=True), ForeignKey("meal_plans.id", ondelete="CASCADE"), nullable=False)
+    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id", ondelete="CASCADE"), nullable=False, index=True)
     date = Column(Date, nullable=False)
     meal_type = Column(String, nullable=False)  # breakfast, lunch, dinner, snack
     attendee_count = Column(Integer, nullable=False, default=1)
 
     plan = relationship("MealPlan", back_populates="planned_meals")
     meal = relationship("Meal", back_populates="planned_meals")
-    attendance = relationship("MealAttendance", back_populates="planned_meal", cascade="all, delete-orphan")
+    # Membership checks only; the primary key already makes each (planned meal, member) row unique
+    attendance = relationship("MealAttendance", back_populates="planned_meal", cascade="all, delete-orphan", passive_deletes=True, collection_class=set)
 
 
 class MealAttendance(Base):
     __tablename__ = "meal_attendance"
 
-    planned_meal_id = Column(UUID(as_uuid=True), ForeignKey("planned_meals.id"), primary_key=True)
-    family_member_id = Column(UUID(as_uuid=True), ForeignKey("family_members.id"), primary_key=True)
+    planned_meal_id = Column(UUID(as_uuid=True), ForeignKey("planned_meals.id", ondelete="CASCADE"), primary_key=True)
+    family_member_id = Column(UUID(as_uuid=True), ForeignKey("family_members.id", ondelete="CASCADE"), primary_key=True, index=True)
 
     planned_meal = relationship("PlannedMeal", back_populates="attendance")
     family_member = relationship("FamilyMember", back_populates="meal_attendance")
\ No newline at end of file
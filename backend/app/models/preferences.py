@@ -1,20 +1,19 @@
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import uuid
 
-from app.db.database import Base
+from app.db.database import Base, TS_NOW
 
 
 class MealRating(Base):
     __tablename__ = "meal_ratings"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
-    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id"), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id", ondelete="CASCADE"), primary_key=True, index=True)
     rating = Column(Integer, nullable=False)  # 1-5 scale
     feedback = Column(String)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
 
     user = relationship("User", back_populates="meal_ratings")
     meal = relationship("Meal", back_populates="meal_ratings")
@@ -24,7 +23,7 @@ class UserPreference(Base):
     __tablename__ = "user_preferences"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     preference_type = Column(String, nullable=False)  # cuisine, diet, health_goal, etc.
     value = Column(String, nullable=False)
     weight = Column(Float, default=1.0)  # importance weight for recommendations
@@ -34,11 +33,15 @@ class UserPreference(Base):
 
 class RecommendationHistory(Base):
     __tablename__ = "recommendation_history"
+    __table_args__ = (
+        # Append-only history queried by time range
+        Index("ix_rec_history_brin", "recommended_at", postgresql_using="brin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id"), nullable=False)
-    recommended_at = Column(DateTime(timezone=True), server_default=func.now())
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    meal_id = Column(UUID(as_uuid=True), ForeignKey("meals.id", ondelete="CASCADE"), nullable=False, index=True)
+    recommended_at = Column(DateTime(timezone=True), server_default=TS_NOW)
     accepted = Column(String)  # accepted, rejected, ignored
     feedback = Column(String)
 
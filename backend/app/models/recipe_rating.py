@@ -4,24 +4,22 @@ Recipe rating model
 from sqlalchemy import Column, String, DateTime, Integer, Boolean, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
 
-from app.db.database import Base
+from app.db.database import Base, uuid7, TS_NOW
 
 
 class RecipeRating(Base):
     __tablename__ = "recipe_ratings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    recipe_id = Column(UUID(as_uuid=True), ForeignKey("recipes_v2.id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    recipe_id = Column(UUID(as_uuid=True), ForeignKey("recipes_v2.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     rating = Column(Integer, nullable=False)  # 1-5 stars
     review_text = Column(Text)
     would_make_again = Column(Boolean, default=True)
     cooking_notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
     recipe = relationship("RecipeV2", back_populates="ratings")
@@ -1,13 +1,11 @@
 """
 RecipeV2 - Clean, simple recipe model
 """
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, JSON, Boolean
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
-import uuid
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred, relationship
 
-from ..db.database import Base
+from ..db.database import Base, uuid7, TS_NOW
 
 
 class RecipeV2(Base):
@@ -15,10 +13,14 @@ class RecipeV2(Base):
     Simple, clean recipe model - no complexity, just what we need
     """
     __tablename__ = "recipes_v2"
+    __table_args__ = (
+        # Tag filters only need containment (tags @> '["vegan"]'), which jsonb_path_ops indexes at about half the size
+        Index("ix_recipe_tags_gin", "tags", postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"}),
+    )
 
     # Basic fields
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Recipe details
     name = Column(String(255), nullable=False)
@@ -27,10 +29,10 @@ class RecipeV2(Base):
     difficulty = Column(String(50), nullable=False)  # Easy, Medium, Hard
     servings = Column(Integer, nullable=False)
     
-    # JSON fields - match frontend structure
-    ingredients_needed = Column(JSON, nullable=True, default=list)  # Array of {name, quantity, unit, have_in_pantry}
-    instructions = Column(JSON, nullable=True, default=list)
-    tags = Column(JSON, nullable=True, default=list)
+    # JSON fields - match frontend structure; deferred so existence checks don't pull them
+    ingredients_needed = deferred(Column(JSONB, nullable=True, default=list), group="details")  # Array of {name, quantity, unit, have_in_pantry}
+    instructions = deferred(Column(JSONB, nullable=True, default=list), group="details")
+    tags = deferred(Column(JSONB, nullable=True, default=list), group="details")
     
     # Optional metadata
     nutrition_notes = Column(Text, default="")
@@ -40,9 +42,10 @@ class RecipeV2(Base):
     ai_provider = Column(String(50), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
     # Relationships
-    user = relationship("User", back_populates="recipes_v2")
-    ratings = relationship("RecipeRating", back_populates="recipe", cascade="all, delete-orphan")
\ No newline at end of file
+    # Not needed by the recipe endpoints, so an accidental per-row load fails loudly
+    user = relationship("User", back_populates="recipes_v2", lazy="raise_on_sql")
+    ratings = relationship("RecipeRating", back_populates="recipe", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
@@ -1,10 +1,9 @@
 from sqlalchemy import Column, String, DateTime, JSON, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 import uuid
 
-from app.db.database import Base
+from app.db.database import Base, TS_NOW
 
 
 class User(Base):
@@ -18,19 +17,19 @@ class User(Base):
     preferences = Column(JSON, default={})
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)  # Added missing field from SQLite schema
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=TS_NOW)
+    updated_at = Column(DateTime(timezone=True), server_default=TS_NOW, onupdate=TS_NOW)
 
-    family_members = relationship("FamilyMember", back_populates="user", cascade="all, delete-orphan")
-    pantry_items = relationship("PantryItem", back_populates="user", cascade="all, delete-orphan")
-    meal_plans = relationship("MealPlan", back_populates="user", cascade="all, delete-orphan")
-    meal_ratings = relationship("MealRating", back_populates="user", cascade="all, delete-orphan")
-    user_preferences = relationship("UserPreference", back_populates="user", cascade="all, delete-orphan")
-    recommendation_history = relationship("RecommendationHistory", back_populates="user", cascade="all, delete-orphan")
-    recipes_v2 = relationship("RecipeV2", back_populates="user", cascade="all, delete-orphan")
+    family_members = relationship("FamilyMember", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    pantry_items = relationship("PantryItem", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    meal_plans = relationship("MealPlan", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    meal_ratings = relationship("MealRating", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    user_preferences = relationship("UserPreference", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    recommendation_history = relationship("RecommendationHistory", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    recipes_v2 = relationship("RecipeV2", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     
     # New content type relationships
-    books = relationship("Book", back_populates="user", cascade="all, delete-orphan")
-    tv_shows = relationship("TVShow", back_populates="user", cascade="all, delete-orphan")
-    movies = relationship("Movie", back_populates="user", cascade="all, delete-orphan")
-    book_recommendation_feedback = relationship("BookRecommendationFeedback", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
+    books = relationship("Book", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    tv_shows = relationship("TVShow", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    movies = relationship("Movie", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    book_recommendation_feedback = relationship("BookRecommendationFeedback", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
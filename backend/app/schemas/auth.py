@@ -5,6 +5,18 @@ import re
 from typing import Optional
 from pydantic import BaseModel, field_validator
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+def _check_email(v):
+    # Allow 'admin' as a special case
+    if v == 'admin':
+        return v
+    # Otherwise validate as email using simple regex
+    if _EMAIL_RE.match(v):
+        return v
+    raise ValueError('Invalid email format')
+
 
 class UserCreate(BaseModel):
     email: str
@@ -14,14 +26,7 @@ class UserCreate(BaseModel):
     @field_validator('email')
     @classmethod
     def validate_email(cls, v):
-        # Allow 'admin' as a special case
-        if v == 'admin':
-            return v
-        # Otherwise validate as email using simple regex
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, v):
-            return v
-        raise ValueError('Invalid email format')
+        return _check_email(v)
 
 
 class UserLogin(BaseModel):
@@ -31,14 +36,7 @@ class UserLogin(BaseModel):
     @field_validator('email')
     @classmethod
     def validate_email(cls, v):
-        # Allow 'admin' as a special case
-        if v == 'admin':
-            return v
-        # Otherwise validate as email using simple regex
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, v):
-            return v
-        raise ValueError('Invalid email format')
+        return _check_email(v)
 
 
 class TokenResponse(BaseModel):
@@ -69,6 +69,33 @@ class BookResponse(BookBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_trusted(cls, book) -> "BookResponse":
+        """Build from a Book row without re-validating fields the row already satisfies"""
+        return cls.model_construct(
+            id=str(book.id),
+            user_id=str(book.user_id),
+            title=book.title,
+            author=book.author,
+            description=book.description,
+            genre=book.genre,
+            isbn=book.isbn,
+            pages=book.pages,
+            publication_year=book.publication_year,
+            cover_image_url=book.cover_image_url,
+            google_books_id=book.google_books_id,
+            open_library_id=book.open_library_id,
+            current_page=book.current_page,
+            reading_status=ReadingStatus(book.reading_status),
+            date_started=book.date_started,
+            date_finished=book.date_finished,
+            user_notes=book.user_notes,
+            is_favorite=book.is_favorite,
+            source=book.source,
+            created_at=book.created_at,
+            updated_at=book.updated_at
+        )
+
 
 class BookListResponse(BaseModel):
     books: List[BookResponse]
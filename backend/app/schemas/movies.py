@@ -62,6 +62,31 @@ class MovieResponse(MovieBase):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_trusted(cls, movie) -> "MovieResponse":
+        """Build from a Movie row without re-validating fields the row already satisfies"""
+        return cls.model_construct(
+            id=str(movie.id),
+            user_id=str(movie.user_id),
+            title=movie.title,
+            description=movie.description,
+            genre=movie.genre,
+            director=movie.director,
+            release_year=movie.release_year,
+            runtime=movie.runtime,
+            poster_image_url=movie.poster_image_url,
+            tmdb_id=movie.tmdb_id,
+            imdb_id=movie.imdb_id,
+            omdb_id=movie.omdb_id,
+            viewing_status=ViewingStatus(movie.viewing_status),
+            date_watched=movie.date_watched,
+            user_notes=movie.user_notes,
+            is_favorite=movie.is_favorite,
+            source=movie.source,
+            created_at=movie.created_at,
+            updated_at=movie.updated_at
+        )
+
 
 class MovieListResponse(BaseModel):
     movies: List[MovieResponse]
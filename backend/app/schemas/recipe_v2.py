@@ -4,6 +4,19 @@ RecipeV2 Pydantic schemas - compatible with frontend and tests
 from typing import List, Optional, Union
 from pydantic import BaseModel, field_validator
 
+# Defaults for an ingredient given only by name
+_INGREDIENT_TEMPLATE = {"quantity": "1", "unit": "unit", "have_in_pantry": False}
+
+
+def _convert_ingredients(v):
+    if not v:
+        return []
+    # The Union field has already parsed the list as all-ingredient or all-string,
+    # so the first item decides the format
+    if isinstance(v[0], str):
+        return [{"name": ingredient, **_INGREDIENT_TEMPLATE} for ingredient in v]
+    return v
+
 
 class IngredientNeeded(BaseModel):
     """Individual ingredient with details"""
@@ -33,26 +46,7 @@ class RecipeV2Create(BaseModel):
     @classmethod
     def convert_ingredients(cls, v):
         """Convert string ingredients to IngredientNeeded objects if needed"""
-        if not v:
-            return []
-        
-        # If it's already a list of IngredientNeeded objects, return as is
-        if all(isinstance(item, dict) and 'name' in item for item in v):
-            return v
-        
-        # If it's a list of strings, convert to IngredientNeeded format
-        if all(isinstance(item, str) for item in v):
-            return [
-                {
-                    "name": ingredient,
-                    "quantity": "1",
-                    "unit": "unit",
-                    "have_in_pantry": False
-                }
-                for ingredient in v
-            ]
-        
-        return v
+        return _convert_ingredients(v)
 
 
 class RecipeV2Update(BaseModel):
@@ -72,26 +66,7 @@ class RecipeV2Update(BaseModel):
     @classmethod
     def convert_ingredients(cls, v):
         """Convert string ingredients to IngredientNeeded objects if needed"""
-        if not v:
-            return []
-        
-        # If it's already a list of IngredientNeeded objects, return as is
-        if all(isinstance(item, dict) and 'name' in item for item in v):
-            return v
-        
-        # If it's a list of strings, convert to IngredientNeeded format
-        if all(isinstance(item, str) for item in v):
-            return [
-                {
-                    "name": ingredient,
-                    "quantity": "1",
-                    "unit": "unit",
-                    "have_in_pantry": False
-                }
-                for ingredient in v
-            ]
-        
-        return v
+        return _convert_ingredients(v)
 
 
 class RecipeV2Response(BaseModel):
@@ -115,4 +90,31 @@ class RecipeV2Response(BaseModel):
     created_at: str
     updated_at: str
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_trusted(cls, recipe, rating: Optional[float] = None) -> "RecipeV2Response":
+        """
+        Build from a RecipeV2 row without re-validating its columns. The stored
+        ingredients are still validated, so a malformed JSONB entry raises here.
+        """
+        return cls.model_construct(
+            id=str(recipe.id),
+            user_id=str(recipe.user_id),
+            name=recipe.name,
+            description=recipe.description,
+            prep_time=recipe.prep_time,
+            difficulty=recipe.difficulty,
+            servings=recipe.servings,
+            ingredients_needed=[IngredientNeeded(**ingredient) for ingredient in recipe.ingredients_needed],
+            instructions=recipe.instructions,
+            tags=recipe.tags,
+            nutrition_notes=recipe.nutrition_notes,
+            pantry_usage_score=recipe.pantry_usage_score,
+            source=recipe.source,
+            ai_generated=recipe.ai_generated,
+            ai_provider=recipe.ai_provider,
+            rating=rating,
+            created_at=recipe.created_at.isoformat(),
+            updated_at=recipe.updated_at.isoformat()
+        )
\ No newline at end of file
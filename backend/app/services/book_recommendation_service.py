@@ -5,7 +5,7 @@ import json
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import desc, and_, or_
 
 import sys
@@ -195,7 +195,7 @@ class BookRecommendationService:
         Build comprehensive user context from reading history and feedback
         """
         # Get user's books
-        books = db.query(Book).filter(Book.user_id == user_id).all()
+        books = db.query(Book).options(undefer(Book.description)).filter(Book.user_id == user_id).all()
         
         # Get user's ratings
         from ..models.content import ContentRating
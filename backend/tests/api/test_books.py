@@ -303,6 +303,42 @@ class TestBooksAPI:
         assert data["progress_percent"] == 100.0
         assert data["reading_status"] == "read"
     
+    def test_rate_book_upserts(self, client: TestClient, auth_headers: dict):
+        """Test rating a book twice updates the one rating instead of adding another"""
+        create_response = client.post(
+            "/api/v1/books",
+            json={"title": "Rated Book", "author": "Rating Author"},
+            headers=auth_headers
+        )
+        book_id = create_response.json()["id"]
+        
+        # First rating inserts
+        response = client.post(
+            f"/api/v1/books/{book_id}/rating",
+            params={"rating": 3, "review_text": "Decent"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["rating"] == 3
+        
+        # Second rating hits the unique (user, content type, item) key and updates
+        response = client.post(
+            f"/api/v1/books/{book_id}/rating",
+            params={"rating": 5, "review_text": "Better on a reread"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["rating"] == 5
+        
+        response = client.get(
+            f"/api/v1/books/{book_id}/rating",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rating"] == 5
+        assert data["review_text"] == "Better on a reread"
+    
     def test_books_health_check(self, client: TestClient, auth_headers: dict):
         """Test books service health check"""
         response = client.get(
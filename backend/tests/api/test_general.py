@@ -17,6 +17,17 @@ class TestGeneralAPI:
         assert "environment" in data
         assert "deployment_info" in data
     
+    def test_health_probes(self, client):
+        """Test the liveness and readiness probes"""
+        response = client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        
+        response = client.get("/health/ready")
+        assert response.status_code in (200, 503)
+        if response.status_code == 503:
+            assert response.headers["retry-after"] == "2"
+    
     def test_root_endpoint(self, client):
         """Test the root endpoint"""
         response = client.get("/")
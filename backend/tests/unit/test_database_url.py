@@ -0,0 +1,53 @@
+import ssl
+
+import pytest
+
+from app.db.database import _async_database_url
+
+SYSTEM_CA_FILE = ssl.get_default_verify_paths().cafile
+
+
+@pytest.mark.unit
+class TestAsyncDatabaseUrl:
+    """Test the mapping of the configured URL onto the asyncio drivers"""
+
+    def test_libpq_params_are_translated_or_dropped(self):
+        url, connect_args = _async_database_url(
+            "postgresql://app:secret@db:5432/food"
+            "?sslmode=require&application_name=food-api"
+            "&options=-c%20statement_timeout%3D5000%20-c%20search_path%3Dpublic"
+            "&target_session_attrs=read-write&connect_timeout=10&keepalives=1"
+        )
+        assert url.drivername == "postgresql+asyncpg"
+        assert dict(url.query) == {}
+        assert connect_args == {
+            "ssl": "require",
+            "server_settings": {
+                "statement_timeout": "5000",
+                "search_path": "public",
+                "application_name": "food-api",
+            },
+            "timeout": 10.0,
+            "target_session_attrs": "read-write",
+        }
+
+    @pytest.mark.skipif(SYSTEM_CA_FILE is None, reason="no system CA bundle to use as sslrootcert")
+    def test_sslrootcert_builds_verifying_context(self):
+        url, connect_args = _async_database_url(
+            f"postgresql://app@db/food?sslmode=verify-full&sslrootcert={SYSTEM_CA_FILE}"
+        )
+        context = connect_args["ssl"]
+        assert "sslrootcert" not in url.query
+        assert isinstance(context, ssl.SSLContext)
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert context.check_hostname
+
+    def test_other_query_params_pass_through(self):
+        url, connect_args = _async_database_url("postgresql://app@db/food?prepared_statement_cache_size=0")
+        assert dict(url.query) == {"prepared_statement_cache_size": "0"}
+        assert connect_args == {}
+
+    def test_sqlite_uses_aiosqlite(self):
+        url, connect_args = _async_database_url("sqlite:///./food.db")
+        assert url.drivername == "sqlite+aiosqlite"
+        assert connect_args == {}
@@ -7,8 +7,10 @@ from app.core.security import (
     create_access_token,
     verify_password,
     hash_password,
+    password_needs_rehash,
     verify_token
 )
+from app.core.config import get_settings
 
 
 @pytest.mark.unit
@@ -46,6 +48,23 @@ class TestSecurityFunctions:
         assert verify_password(password, hash1) is True
         assert verify_password(password, hash2) is True
     
+    def test_password_needs_rehash(self):
+        """Test rehash detection for legacy and re-costed hashes"""
+        import hashlib
+        import bcrypt
+        
+        # Freshly hashed passwords use the configured cost
+        assert password_needs_rehash(hash_password("test_password_123")) is False
+        
+        # Legacy SHA-256 hashes must be upgraded
+        legacy_hash = hashlib.sha256(b"test_password_123").hexdigest()
+        assert password_needs_rehash(legacy_hash) is True
+        
+        # bcrypt hashes with a different cost factor are re-hashed
+        other_cost = get_settings().BCRYPT_ROUNDS + 1
+        old_hash = bcrypt.hashpw(b"test_password_123", bcrypt.gensalt(rounds=other_cost)).decode("utf-8")
+        assert password_needs_rehash(old_hash) is True
+    
     @patch('app.core.security.settings')
     def test_create_access_token_default_expiration(self, mock_settings):
         """Test creating access token with default expiration"""
@@ -152,6 +171,17 @@ class TestSecurityFunctions:
         
         assert payload is None
     
+    @patch('app.core.security.settings')
+    def test_verify_token_rejects_other_algorithms(self, mock_settings):
+        """Test that HS256 verification refuses tokens signed with another alg"""
+        mock_settings.JWT_SECRET = "test_secret_key"
+        mock_settings.JWT_ALGORITHM = "HS256"
+        
+        exp = datetime.utcnow() + timedelta(hours=1)
+        token = jwt.encode({"sub": "user@example.com", "exp": exp}, "test_secret_key", algorithm="HS512")
+        
+        assert verify_token(token) is None
+    
     @patch('app.core.security.settings')
     def test_verify_token_wrong_secret(self, mock_settings):
         """Test verifying token with wrong secret"""
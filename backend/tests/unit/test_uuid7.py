@@ -0,0 +1,26 @@
+import time
+
+import pytest
+
+from app.db.database import uuid7
+
+
+@pytest.mark.unit
+class TestUUID7:
+    """Test the time-ordered primary key generator"""
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_current_millisecond(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_ordered_across_milliseconds(self):
+        first = uuid7()
+        time.sleep(0.002)
+        assert uuid7() > first